@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+'''Benchmarks of the game engine and the domino rendering
+
+Every benchmark works on the same seeded games and tiles each run and
+reports its best of --repeat runs, so results can be saved with --output
+and compared between two versions of the code with --compare:
+
+    python bench.py --output before.json
+    ... change something ...
+    python bench.py --compare before.json
+
+Rates are higher is better, seconds lower is better; the ratio printed by
+--compare is above 1 when the new run is faster.  --instrument plays the
+games once more with instrument.Instruments on and shows where the time
+of a game goes.
+'''
+from __future__ import print_function
+import argparse
+import json
+import platform
+import shutil
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+
+import mkdom
+import tiles
+from doublesix import Player, Board, Game
+from instrument import Instruments
+from render import TileRenderer
+from simulate import game_seed
+
+SEATS = 4
+DOMINOES = [(i, j) for i in range(7) for j in range(i, 7)]
+
+
+def best(function, repeat):
+    '''Lowest seconds of repeat calls of function'''
+    times = []
+    for r in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def play_games(games, seed):
+    '''Play seeded games, returns the number of tiles played'''
+    players = [Player(seat) for seat in range(SEATS)]
+    moves = 0
+    for index in range(games):
+        game = Game(players, seed=game_seed(seed, index), verbose=False)
+        game.deal()
+        game.play_game()
+        moves += game.moves
+    return moves
+
+
+def bench_games(games, seed, repeat):
+    moves = play_games(games, seed)
+    seconds = best(lambda: play_games(games, seed), repeat)
+    return {'games_per_second': games / seconds, 'moves_per_second': moves / seconds}
+
+
+def bench_deal(games, seed, repeat):
+    players = [Player(seat) for seat in range(SEATS)]
+
+    def deal():
+        game = Game(players, seed=seed, verbose=False)
+        for index in range(games):
+            game.deal()
+    return {'deals_per_second': games / best(deal, repeat)}
+
+
+def bench_putdown(games, seed, repeat):
+    # the tiles of seeded games in the order they were put down
+    chains = []
+    players = [Player(seat) for seat in range(SEATS)]
+    for index in range(games):
+        game = Game(players, seed=game_seed(seed, index), verbose=False)
+        game.deal()
+        game.play_game()
+        chains.append([tiles.TILES[n] for n, side, left, right in game.board.history])
+    moves = sum(len(chain) for chain in chains)
+
+    def putdown():
+        for chain in chains:
+            board = Board()
+            for domino in chain:
+                board.putdown(domino)
+    return {'putdowns_per_second': moves / best(putdown, repeat)}
+
+
+def bench_render(rounds, repeat):
+    def build():
+        for r in range(rounds):
+            for i, j in DOMINOES:
+                ET.tostring(mkdom.DominoSVG(i, j, css_styles=True).svg)
+
+    # warmed up so the runs time cache hits only
+    renderer = TileRenderer()
+    for tile in DOMINOES:
+        renderer.render(tile, css_styles=True)
+
+    def cached():
+        for r in range(rounds):
+            for tile in DOMINOES:
+                renderer.render(tile, css_styles=True)
+    count = rounds * len(DOMINOES)
+    return {'tiles_per_second': count / best(build, repeat),
+            'cached_tiles_per_second': count / best(cached, repeat)}
+
+
+def bench_mkpython(repeat):
+    outdir = tempfile.mkdtemp()
+    try:
+        dominoes = [mkdom.DominoSVG(i, j, fg='{fg}', bg='{bg}', matrix='{matrix}',
+                                    css_styles=True) for i, j in DOMINOES]
+        return {
+            'seconds': best(lambda: mkdom.mkpython(dominoes, outdir=outdir), repeat),
+            'compact_seconds': best(
+                lambda: mkdom.mkpython(dominoes, outdir=outdir, compact=True), repeat),
+        }
+    finally:
+        shutil.rmtree(outdir)
+
+
+def run(games=2000, rounds=50, seed=0, repeat=3):
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'benchmarks': {
+            'games': bench_games(games, seed, repeat),
+            'deal': bench_deal(games, seed, repeat),
+            'putdown': bench_putdown(games, seed, repeat),
+            'render': bench_render(rounds, repeat),
+            'mkpython': bench_mkpython(repeat),
+        },
+    }
+
+
+def compare(old, new):
+    '''Lines of old and new values of every benchmark and new/old speed'''
+    lines = ['{:30} {:>14} {:>14} {:>7}'.format('benchmark', 'old', 'new', 'speed')]
+    for name, metrics in sorted(new['benchmarks'].items()):
+        for metric, value in sorted(metrics.items()):
+            was = old['benchmarks'].get(name, {}).get(metric)
+            if not was or not value:
+                speed = ''
+            elif metric.endswith('seconds') and not metric.endswith('per_second'):
+                speed = '{:.2f}x'.format(was / value)
+            else:
+                speed = '{:.2f}x'.format(value / was)
+            lines.append('{:30} {:>14} {:>14.4g} {:>7}'.format(
+                name + '.' + metric, '-' if was is None else '{:.4g}'.format(was),
+                value, speed))
+    return '\n'.join(lines)
+
+
+def report(results):
+    lines = []
+    for name, metrics in sorted(results['benchmarks'].items()):
+        for metric, value in sorted(metrics.items()):
+            lines.append('{:30} {:14.4g}'.format(name + '.' + metric, value))
+    return '\n'.join(lines)
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Benchmark the doublesix engine and rendering')
+    ap.add_argument('--games', '-n', action='store', type=int, default=2000)
+    ap.add_argument('--rounds', action='store', type=int, default=50,
+                    help='Times every tile is rendered')
+    ap.add_argument('--seed', '-s', action='store', type=int, default=0)
+    ap.add_argument('--repeat', '-r', action='store', type=int, default=3)
+    ap.add_argument('--output', '-o', action='store', default=None,
+                    help='Write the results to this JSON file')
+    ap.add_argument('--compare', '-c', action='store', default=None,
+                    help='Compare with the results in this JSON file')
+    ap.add_argument('--instrument', action='store_true',
+                    help='Show the time spent in each phase of a game')
+    args = ap.parse_args()
+
+    results = run(args.games, args.rounds, args.seed, args.repeat)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            print(compare(json.load(f), results))
+    else:
+        print(report(results))
+
+    if args.instrument:
+        with Instruments() as inst:
+            play_games(args.games, args.seed)
+        print()
+        print(inst.report())
+
+
+if __name__ == '__main__':
+    main()
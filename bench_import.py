@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+'''Compare importing a full and a compact generated dominoes module
+
+Both modules are generated into a temporary directory with mkdom and each
+is imported in fresh interpreters: once to time the import, once under
+tracemalloc to see the memory the module holds right after the import and
+after drawing a few tiles.  Finding the file dominates the import time of
+such small modules, so the time to load and run the compiled code alone is
+measured in process as well.
+'''
+from __future__ import print_function
+import argparse
+import json
+import marshal
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+
+import mkdom
+
+CHILD = \
+'''import sys, time
+sys.path.insert(0, {dir!r})
+if {traced}:
+    import tracemalloc
+    tracemalloc.start()
+start = time.perf_counter()
+import dominoes
+seconds = time.perf_counter() - start
+result = {{'seconds': seconds}}
+if {traced}:
+    result['memory'] = tracemalloc.get_traced_memory()[0]
+    keys = sorted(dominoes.SVG_DICT)[:{touch}]
+    svgs = [dominoes.SVG_DICT[k] for k in keys]
+    result['memory_touched'] = tracemalloc.get_traced_memory()[0]
+print(repr(result))
+'''
+
+
+def generate(outdir, compact):
+    dominoes = [mkdom.DominoSVG(i, j, fg='{fg}', bg='{bg}', matrix='{matrix}',
+                                css_styles=True)
+                for i in range(7) for j in range(i, 7)]
+    mkdom.mkpython(dominoes, outdir=outdir, compact=compact)
+
+
+def measure(directory, traced, touch):
+    code = CHILD.format(dir=directory, traced=traced, touch=touch)
+    out = subprocess.check_output([sys.executable, '-c', code])
+    return eval(out)
+
+
+def exec_seconds(path, number=2000):
+    '''Seconds to unmarshal and run the compiled module, and its size'''
+    with open(path) as f:
+        data = marshal.dumps(compile(f.read(), path, 'exec'))
+    seconds = timeit.timeit(lambda: exec(marshal.loads(data), {}), number=number)
+    return seconds / number, len(data)
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def bench(runs=20, touch=3):
+    '''Median import seconds and traced bytes of both kinds of module'''
+    tmp = tempfile.mkdtemp()
+    results = {}
+    try:
+        for name, compact in (('full', False), ('compact', True)):
+            directory = os.path.join(tmp, name)
+            os.makedirs(directory)
+            generate(directory, compact)
+            # the first import compiles the module, workers import the .pyc
+            measure(directory, False, touch)
+            timed = [measure(directory, False, touch)['seconds'] for r in range(runs)]
+            traced = measure(directory, True, touch)
+            path = os.path.join(directory, 'dominoes.py')
+            code_seconds, code_bytes = exec_seconds(path)
+            results[name] = {
+                'import_seconds': median(timed),
+                'exec_seconds': code_seconds,
+                'code_bytes': code_bytes,
+                'memory': traced['memory'],
+                'memory_touched': traced['memory_touched'],
+                'source_bytes': os.path.getsize(path),
+            }
+    finally:
+        shutil.rmtree(tmp)
+    return results
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--runs', '-n', action='store', type=int, default=20)
+    ap.add_argument('--touch', action='store', type=int, default=3,
+                    help='Number of tiles drawn after the import')
+    ap.add_argument('--json', action='store_true', help='Print the results as JSON')
+    args = ap.parse_args()
+
+    results = bench(args.runs, args.touch)
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return
+    print('{:8} {:>10} {:>8} {:>10} {:>16} {:>8} {:>8}'.format(
+        'module', 'import us', 'exec us', 'memory B',
+        'after {} tiles B'.format(args.touch), 'code B', 'source B'))
+    for name in ('full', 'compact'):
+        r = results[name]
+        print('{:8} {:10.1f} {:8.1f} {:10d} {:16d} {:8d} {:8d}'.format(
+            name, r['import_seconds'] * 1e6, r['exec_seconds'] * 1e6, r['memory'],
+            r['memory_touched'], r['code_bytes'], r['source_bytes']))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,66 +2,66 @@ DWIDTH = 96
 DHEIGHT = 192
 M2d_IDENTITY = '1, 0, 0, 1, 0, 0'
 M2d_ROTLEFT = '0, -1, 1, 0, 0, 106'
-M2d_ROTRIGHT = '0, 1, -1, 0, 0, 202'
+M2d_ROTRIGHT = '0, 1, -1, 0, 202, 0'
 SVG_DICT = dict( (
     ((0, 0), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /></g></svg>'''),
     ((0, 1), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="48" cy="48" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="48" cy="48" /></g></g></svg>'''),
     ((0, 2), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((0, 3), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="48" cy="48" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="48" cy="48" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((0, 4), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((0, 5), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="48" cy="48" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="48" cy="48" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((0, 6), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="47" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="47" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="47" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="47" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((1, 1), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="48" cy="48" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="48" cy="48" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="48" cy="48" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="48" cy="48" /></g></g></svg>'''),
     ((1, 2), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="48" cy="48" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="48" cy="48" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((1, 3), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="48" cy="48" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="48" cy="48" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="48" cy="48" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="48" cy="48" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((1, 4), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="48" cy="48" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="48" cy="48" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((1, 5), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="48" cy="48" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="48" cy="48" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="48" cy="48" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="48" cy="48" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((1, 6), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="48" cy="48" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="47" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="47" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="48" cy="48" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="47" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="47" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((2, 2), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((2, 3), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="48" cy="48" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="48" cy="48" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((2, 4), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((2, 5), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="48" cy="48" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="48" cy="48" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((2, 6), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="47" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="47" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="47" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="47" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((3, 3), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="48" cy="48" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="48" cy="48" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="48" cy="48" /><circle class="pip" r="7" cx="16" cy="78" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="48" cy="48" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((3, 4), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="48" cy="48" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="48" cy="48" /><circle class="pip" r="7" cx="16" cy="78" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((3, 5), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="48" cy="48" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="48" cy="48" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="48" cy="48" /><circle class="pip" r="7" cx="16" cy="78" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="48" cy="48" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((3, 6), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="48" cy="48" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="47" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="47" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="48" cy="48" /><circle class="pip" r="7" cx="16" cy="78" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="47" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="47" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((4, 4), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((4, 5), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="48" cy="48" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="48" cy="48" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((4, 6), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="47" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="47" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="47" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="47" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((5, 5), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="48" cy="48" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="48" cy="48" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="48" cy="48" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="48" cy="48" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((5, 6), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="48" cy="48" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="47" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="47" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="48" cy="48" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="78" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="47" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="47" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
     ((6, 6), '''<svg xmlns="http://www.w3.org/2000/svg">
-<g transform="matrix({matrix})"><rect class="rect" height="192" width="96" x="5" y="5" /><line class="line" x1="11" x2="95" y1="101" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="47" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="47" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" cx="78" cy="16" r="7" /><circle class="pip" cx="78" cy="47" r="7" /><circle class="pip" cx="78" cy="78" r="7" /><circle class="pip" cx="16" cy="16" r="7" /><circle class="pip" cx="16" cy="47" r="7" /><circle class="pip" cx="16" cy="78" r="7" /></g></g></svg>'''),
-    )
-DOMINO_CSS = .rect { stroke: rgb(0,0,0); fill: rgb(255,255,255); stroke-width: 2px; stroke-linejoin: round; stroke-linecap: round;  }
+<g transform="matrix({matrix})"><rect class="rect" x="5" y="5" width="96" height="192" /><line class="line" x1="11" y1="101" x2="95" y2="101" /><g transform="matrix(1, 0, 0, 1, 5, 5)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="47" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="47" /><circle class="pip" r="7" cx="16" cy="78" /></g><g transform="matrix(1, 0, 0, 1, 5, 101)"><circle class="pip" r="7" cx="78" cy="16" /><circle class="pip" r="7" cx="78" cy="47" /><circle class="pip" r="7" cx="78" cy="78" /><circle class="pip" r="7" cx="16" cy="16" /><circle class="pip" r="7" cx="16" cy="47" /><circle class="pip" r="7" cx="16" cy="78" /></g></g></svg>'''),
+    ))
+DOMINO_CSS = '''.rect { stroke: rgb(0,0,0); fill: rgb(255,255,255); stroke-width: 2px; stroke-linejoin: round; stroke-linecap: round;  }
 .line { stroke: rgb(0,0,0); stroke-width: 1px;  }
 .pip  { stroke: rgb(0,0,0); fill: rgb(0,0,0);  }
-
+'''
@@ -1,54 +1,142 @@
+import collections
 import random
 
+import tiles
+
 class Player:
   def __init__(self, name):
-    self.dominoes = []
+    #the hand is a set of tile indices as a bitmask, see tiles.py
+    self.hand = 0
     self.myname = name
+    #set when the player sits down at a Game
+    self.game = None
+    self.seat = None
+
+  @property
+  def dominoes(self):
+    return [list(tiles.TILES[n]) for n in tiles.indices(self.hand)]
 
   def assign (self, d):
-    self.dominoes = d
+    self.hand = d if isinstance(d, int) else tiles.mask(d)
+
+  def play(self, board=None):
+    '''Take a domino from the hand.  Given a board, only a domino that can be
+    played on it is taken and None means the player has to pass'''
+    if board is None:
+      playable = self.hand
+    else:
+      playable = self.hand & board.playable()
+      if not playable:
+        return None
+    n = playable.bit_length() - 1
+    self.hand ^= tiles.BIT[n]
+    return tiles.TILES[n]
 
-  def play(self):
-    return self.dominoes.pop()
+  def pips(self):
+    return tiles.pips(self.hand)
 
   def __repr__(self):
     return str(self.myname) + str(self.dominoes)
 
 
 
+LEFT = 0
+RIGHT = 1
+
 class Board:
   def __init__(self):
-    self.played_dominoes = []
+    #the open ends, None while the board is empty
+    self.left = None
+    self.right = None
+    #set of played tiles and how often each pip value shows on them
+    self.played = 0
+    self.counts = [0] * 7
+    #(tile, side, left, right) before each play, so it can be undone
+    self.history = []
+    self._chain = None
 
   def available_plays(self):
-    #if the list is empty allow any plays
-    if self.played_dominoes:
-      #if there are played dominoes the available plays are the first value of the first domino or the last value of the last domino
-      available = [self.played_dominoes[0][0],self.played_dominoes[-1][-1]]
+    #if the board is empty allow any plays
+    if self.history:
+      available = [self.left, self.right]
     else:
       available=[0,1,2,3,4,5,6]
     return available
 
-  def putdown (self, domino):
-    '''Put down a domino'''
-    domino= list(domino)
-
-    if self.played_dominoes:
-      beginning = self.played_dominoes[0][0]
-      if beginning in domino:
-        if beginning == domino[0]:
-          domino.reverse()
-        self.played_dominoes.insert(0,domino)
-      else:
-        end = self.played_dominoes[-1][-1]
-        if end in domino:
-          if end == domino[1]:
-            domino.reverse()
-          self.played_dominoes.append(domino)
-        else:
-          print ("Can't play that dummy",domino)
+  def playable(self):
+    '''Set of tiles matching an open end, any tile on an empty board'''
+    if self.history:
+      return tiles.PIP_MASK[self.left] | tiles.PIP_MASK[self.right]
+    return tiles.ALL_TILES
+
+  def side(self, n):
+    '''Side tile n goes when put down, the left end is tried first'''
+    if not self.history:
+      return RIGHT
+    bit = tiles.BIT[n]
+    if bit & tiles.PIP_MASK[self.left]:
+      return LEFT
+    if bit & tiles.PIP_MASK[self.right]:
+      return RIGHT
+    return None
+
+  def play(self, n, side):
+    '''Put tile n on side LEFT or RIGHT, it has to match that end'''
+    i, j = tiles.TILES[n]
+    left = self.left
+    right = self.right
+    self.history.append((n, side, left, right))
+    self.played |= tiles.BIT[n]
+    self.counts[i] += 1
+    self.counts[j] += 1
+    if left is None:
+      self.left = i
+      self.right = j
+    elif side == LEFT:
+      self.left = j if i == left else i
+    else:
+      self.right = j if i == right else i
+    self._chain = None
+
+  def undo(self):
+    '''Take back the last play'''
+    n, side, self.left, self.right = self.history.pop()
+    i, j = tiles.TILES[n]
+    self.played ^= tiles.BIT[n]
+    self.counts[i] -= 1
+    self.counts[j] -= 1
+    self._chain = None
+
+  def putdown (self, domino, side=None):
+    '''Put down a domino, returns the side it went or None.  Without a side
+    the left end is tried first'''
+    n = tiles.index(domino)
+    if side is None:
+      side = self.side(n)
+    elif self.history and not tiles.BIT[n] & tiles.PIP_MASK[
+        self.left if side == LEFT else self.right]:
+      side = None
+    if side is None:
+      print ("Can't play that dummy",list(domino))
     else:
-      self.played_dominoes.insert(0,domino)
+      self.play(n, side)
+    return side
+
+  @property
+  def played_dominoes(self):
+    '''The chain of played dominoes, only built when asked for'''
+    if self._chain is None:
+      chain = collections.deque()
+      for n, side, left, right in self.history:
+        i, j = tiles.TILES[n]
+        if left is None:
+          chain.append([i, j])
+        elif side == LEFT:
+          chain.appendleft([j if i == left else i, left])
+        else:
+          chain.append([right, j if i == right else i])
+      self._chain = list(chain)
+    return self._chain
 
   def __repr__(self):
     return str(self.played_dominoes)
@@ -57,27 +145,77 @@ class Board:
 
 
 class Game:
-  def __init__(self, players):
-    self.board = Board()
+  def __init__(self, players, seed=None, verbose=True, log=None):
     #players is a list of 4 player objects
     self.players = players
     assert isinstance(players, list) and len(players) == 4
+    for seat, p in enumerate(players):
+      p.game = self
+      p.seat = seat
+    #a seed gives the game its own random generator so deals can be reproduced
+    self.seed = seed
+    self.rng = random if seed is None else random.Random(seed)
+    self.verbose = verbose
+    #a gamelog.GameWriter (or anything with begin, move and end) to record to
+    self.log = log
+    self.reset()
+
+  def reset(self):
+    self.board = Board()
+    self.turn = 0
+    self.passes = 0
+    self.moves = 0
+    self.winner = None
+    self.blocked = False
+    #tiles each seat is known not to hold because it passed on them
+    self.voids = [0] * len(self.players)
 
   def deal(self):
-    dominoes=[]
-    for i in range (0,7):
-      for j in range (i,7):
-        dominoes.append( [i,j] )
-    random.shuffle(dominoes)
-    self.players[0].assign(dominoes[0:7])
-    self.players[1].assign(dominoes[7:14])
-    self.players[2].assign(dominoes[14:21])
-    self.players[3].assign(dominoes[21:28])
+    self.reset()
+    dominoes = list(range(tiles.NTILES))
+    self.rng.shuffle(dominoes)
+    for i, p in enumerate(self.players):
+      hand = 0
+      for n in dominoes[7*i:7*i+7]:
+        hand |= tiles.BIT[n]
+      p.assign(hand)
+    if self.log is not None:
+      self.log.begin(self)
+
+  def play_turn(self, domino, side=None):
+    '''Play a domino (None to pass) for the player whose turn it is, on the
+    given side or the left end first.  Returns True when the game is over'''
+    p = self.players[self.turn]
+    if domino is None:
+      self.passes += 1
+      self.voids[self.turn] |= self.board.playable()
+      if self.log is not None:
+        self.log.move(None, None)
+      if self.verbose:
+        print (p.myname, "passed")
+    else:
+      self.passes = 0
+      self.moves += 1
+      side = self.board.putdown(domino, side)
+      if self.log is not None:
+        self.log.move(tiles.index(domino), side)
+      if self.verbose:
+        print (p.myname, "played", domino, "has", p.dominoes)
+        print ("")
+
+    if not p.hand:
+      self.winner = self.turn
+    elif self.passes == len(self.players):
+      #nobody can play, the lowest count of pips in hand wins
+      self.blocked = True
+      pips = [sp.pips() for sp in self.players]
+      self.winner = pips.index(min(pips))
+    if self.winner is not None and self.log is not None:
+      self.log.end(self)
+    self.turn = (self.turn + 1) % len(self.players)
+    return self.winner is not None
 
   def play_game(self):
-    while any( [sp.dominoes for sp in self.players] ):
-      for p in self.players:
-        d= p.play()
-        print (p.myname, "played", d, "has", p.dominoes)
-        print ("")
-        self.board.putdown(d)
\ No newline at end of file
+    while self.winner is None:
+      self.play_turn(self.players[self.turn].play(self.board))
+    return self.winner
@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+'''Compact binary record of doublesix games
+
+A log file is a header, one record per game and, once the writer is
+closed, an index of the offset of every record followed by a trailer:
+
+    header   'DSGL', version byte, 3 pad bytes
+    record   seed     u64, NO_SEED when the game was not seeded
+             deal     u64, the seat holding tile n in bits 2n and 2n+1
+             turns    u8, then one byte per turn: tile index | side << 5,
+                      PASS for a pass
+    index    u64 offset of each record
+    trailer  u64 number of records, u64 offset of the index, 'DSGX'
+
+All numbers are little endian.  A Game given a GameWriter as its log
+appends a record as it plays.  GameReader maps a log into memory and
+replays any game, or the position after any turn of it, from the index.
+A log whose writer was not closed has no index; the reader then finds the
+records by scanning the file once.
+'''
+from __future__ import print_function
+import argparse
+import array
+import collections
+import mmap
+import struct
+import sys
+
+import tiles
+from doublesix import Player, Game
+
+MAGIC = b'DSGL'
+END_MAGIC = b'DSGX'
+VERSION = 1
+HEADER = struct.Struct('<4sB3x')
+RECORD = struct.Struct('<QQB')
+TRAILER = struct.Struct('<QQ4s')
+
+SEATS = 4
+NO_SEED = (1 << 64) - 1
+PASS = 0xFF
+SIDE_SHIFT = 5
+
+Record = collections.namedtuple('Record', 'seed hands turns')
+
+
+def deal_word(hands):
+    '''The deal of 4 hand bitmasks as one int, 2 bits of seat per tile'''
+    word = 0
+    for seat, hand in enumerate(hands):
+        for n in tiles.indices(hand):
+            word |= seat << 2 * n
+    return word
+
+
+def deal_hands(word):
+    '''Hand bitmasks of a deal stored by deal_word'''
+    hands = [0] * SEATS
+    for n in range(tiles.NTILES):
+        hands[word >> 2 * n & 3] |= tiles.BIT[n]
+    return hands
+
+
+def encode(seed, hands, turns):
+    '''Bytes of a record, turns is a bytes like sequence of turn bytes'''
+    if seed is None:
+        seed = NO_SEED
+    elif not 0 <= seed < NO_SEED:
+        raise ValueError('seed {} does not fit in a record'.format(seed))
+    return RECORD.pack(seed, deal_word(hands), len(turns)) + bytes(turns)
+
+
+class Recorder(object):
+    '''Collects a record per game played with it as the log of a Game'''
+    def __init__(self):
+        self.records = []
+        self._seed = None
+        self._hands = None
+        self._turns = None
+
+    def begin(self, game):
+        self._seed = game.seed
+        self._hands = [p.hand for p in game.players]
+        self._turns = bytearray()
+
+    def move(self, n, side):
+        if n is None:
+            self._turns.append(PASS)
+        elif side is None:
+            raise ValueError('tile {} was not played, it can not be recorded'
+                             .format(tiles.TILES[n]))
+        else:
+            self._turns.append(n | side << SIDE_SHIFT)
+
+    def end(self, game):
+        self.write(encode(self._seed, self._hands, self._turns))
+        self._turns = None
+
+    def write(self, record):
+        self.records.append(record)
+
+
+class GameWriter(Recorder):
+    '''Streams records to a log file, close() adds the index'''
+    def __init__(self, path):
+        Recorder.__init__(self)
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION))
+        self.offset = HEADER.size
+        self.offsets = array.array('Q')
+
+    def write(self, record):
+        self.offsets.append(self.offset)
+        self.file.write(record)
+        self.offset += len(record)
+
+    def close(self):
+        if self.file.closed:
+            return
+        index = array.array('Q', self.offsets)
+        if sys.byteorder == 'big':
+            index.byteswap()
+        self.file.write(index.tobytes())
+        self.file.write(TRAILER.pack(len(self.offsets), self.offset, END_MAGIC))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def replay(record, turns=None):
+    '''Game of a Record after its first turns turns, all of them by default'''
+    players = [Player(seat) for seat in range(SEATS)]
+    game = Game(players, seed=None if record.seed == NO_SEED else record.seed,
+                verbose=False)
+    for p, hand in zip(players, record.hands):
+        p.assign(hand)
+    for b in record.turns[:turns]:
+        if b == PASS:
+            game.play_turn(None)
+            continue
+        n = b & (1 << SIDE_SHIFT) - 1
+        p = players[game.turn]
+        if n >= tiles.NTILES or not p.hand & tiles.BIT[n]:
+            raise ValueError('record plays a tile seat {} does not hold'.format(p.seat))
+        p.hand ^= tiles.BIT[n]
+        game.play_turn(tiles.TILES[n], b >> SIDE_SHIFT)
+    return game
+
+
+class GameReader(object):
+    '''Random access to the records of a log file mapped into memory'''
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('{} is not a version {} game log'.format(path, VERSION))
+        self.offsets = self._read_index()
+        if self.offsets is None:
+            self.offsets = self._scan()
+
+    def _read_index(self):
+        size = len(self.map)
+        if size < HEADER.size + TRAILER.size:
+            return None
+        count, at, magic = TRAILER.unpack_from(self.map, size - TRAILER.size)
+        if magic != END_MAGIC or at + 8 * count != size - TRAILER.size:
+            return None
+        offsets = array.array('Q')
+        offsets.frombytes(self.map[at:at + 8 * count])
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+        return offsets
+
+    def _scan(self):
+        '''Offsets of the records of a log without an index, a record cut
+        short by a writer that stopped is left out'''
+        offsets = array.array('Q')
+        at = HEADER.size
+        size = len(self.map)
+        while at + RECORD.size <= size:
+            end = at + RECORD.size + self.map[at + RECORD.size - 1]
+            if end > size:
+                break
+            offsets.append(at)
+            at = end
+        return offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, i):
+        at = self.offsets[i]
+        seed, word, count = RECORD.unpack_from(self.map, at)
+        start = at + RECORD.size
+        return Record(seed, deal_hands(word), self.map[start:start + count])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def game(self, i):
+        '''Game i replayed to its end'''
+        return replay(self[i])
+
+    def position(self, i, turn):
+        '''Game i as it stood after its first turn turns'''
+        return replay(self[i], turn)
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Show games of a doublesix game log')
+    ap.add_argument('path', action='store')
+    ap.add_argument('--game', '-g', action='store', type=int, default=None,
+                    help='Replay this game, default a summary of the log')
+    ap.add_argument('--turn', '-t', action='store', type=int, default=None,
+                    help='Stop the replay after this many turns')
+    args = ap.parse_args()
+
+    with GameReader(args.path) as log:
+        if args.game is None:
+            print('{} games'.format(len(log)))
+            return
+        record = log[args.game]
+        game = replay(record, args.turn)
+        print('seed:', None if record.seed == NO_SEED else record.seed)
+        print('board:', game.board)
+        for p in game.players:
+            print('seat {}: {}'.format(p.seat, p.dominoes))
+        if game.winner is not None:
+            print('winner: seat {}{}'.format(game.winner,
+                                             ' (blocked)' if game.blocked else ''))
+        else:
+            print('seat {} to play'.format(game.turn))
+
+
+if __name__ == '__main__':
+    main()
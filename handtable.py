@@ -0,0 +1,274 @@
+#!/usr/bin/env python
+'''Table of the value of every 7 tile hand, built once and mapped into memory
+
+The C(28, 7) = 1184040 hands are numbered in the combinatorial number
+system: a hand holding tile indices c1 < c2 < ... < c7 has rank
+C(c1, 1) + C(c2, 2) + ... + C(c7, 7).  This is the colexicographic order,
+which for hand bitmasks (see tiles.py) is simply increasing order, so
+rank() and unrank() convert between the two in a few steps.
+
+The table file is a header followed by one fixed size record per rank:
+
+    header   'DSHT', version byte, pad, u32 hands, u32 samples, u64 seed
+    record   u8 pips, u8 doubles, u8 longest suit, u8 suits, f32 equity
+
+The longest suit is the most tiles in the hand showing one pip value and
+suits the number of pip values it shows.  Equity is the share of games the
+hand wins in samples random deals of the other 21 tiles, played by the
+policy of Player.play with the hand at each seat in turn, so 0.25 is an
+average hand.  Building needs numpy (the games are played with
+vectorized.play) and runs ranges of ranks on a pool of processes; reading
+a table only maps the file.
+
+    python handtable.py build hands.dsht --samples 64
+    python handtable.py show hands.dsht 6,6 5,6 5,5 4,6 4,5 3,6 4,4
+'''
+from __future__ import print_function
+import argparse
+import collections
+import mmap
+import multiprocessing
+import operator
+import os
+import struct
+import time
+
+import tiles
+
+try:
+    import numpy as np
+    import vectorized
+except ImportError:
+    # only needed to build a table
+    np = None
+
+HAND = 7
+SEATS = 4
+MAGIC = b'DSHT'
+VERSION = 1
+HEADER = struct.Struct('<4sBxxxIIQ')
+RECORD = struct.Struct('<BBBBf')
+EQUITY = struct.Struct('<f')
+EQUITY_OFFSET = 4
+CHUNK = 4096
+
+# BINOM[n][k] = C(n, k)
+BINOM = [[0] * (HAND + 1) for n in range(tiles.NTILES + 1)]
+for _n in range(tiles.NTILES + 1):
+    BINOM[_n][0] = 1
+    for _k in range(1, min(_n, HAND) + 1):
+        BINOM[_n][_k] = BINOM[_n - 1][_k - 1] + BINOM[_n - 1][_k]
+HANDS = BINOM[tiles.NTILES][HAND]
+
+HandValues = collections.namedtuple('HandValues', 'pips doubles longest suits equity')
+
+
+def rank(hand):
+    '''Rank of a 7 tile hand, a bitmask (any integer, numpy ones too) or a
+    list of pairs'''
+    try:
+        m = operator.index(hand)
+    except TypeError:
+        m = tiles.mask(hand)
+    r = 0
+    k = 0
+    while m:
+        low = m & -m
+        k += 1
+        r += BINOM[low.bit_length() - 1][k]
+        m ^= low
+    if k != HAND:
+        raise ValueError('a hand has {} tiles, not {}'.format(HAND, k))
+    return r
+
+
+def unrank(r):
+    '''Bitmask of the hand of rank r'''
+    if not 0 <= r < HANDS:
+        raise IndexError('hand rank {} out of range'.format(r))
+    m = 0
+    n = tiles.NTILES
+    for k in range(HAND, 0, -1):
+        n -= 1
+        while BINOM[n][k] > r:
+            n -= 1
+        r -= BINOM[n][k]
+        m |= tiles.BIT[n]
+    return m
+
+
+def next_hand(m):
+    '''The hand of the next rank, the next larger int with as many bits'''
+    low = m & -m
+    ripple = m + low
+    return ripple | ((m ^ ripple) >> 2) // low
+
+
+def hand_masks(start, stop):
+    '''Bitmasks of the hands of ranks [start, stop) as an int32 array'''
+    masks = np.empty(stop - start, dtype=np.int32)
+    m = unrank(start)
+    for i in range(stop - start):
+        masks[i] = m
+        m = next_hand(m)
+    return masks
+
+
+def features(masks):
+    '''pips, doubles, longest suit and suits of an array of hands'''
+    suit = np.stack([vectorized.count(masks & tiles.PIP_MASK[v]) for v in range(7)])
+    return (vectorized.pips(masks), vectorized.count(masks & tiles.DOUBLES),
+            suit.max(axis=0), (suit > 0).sum(axis=0))
+
+
+def equity(masks, samples, rng):
+    '''Share of games won by each hand over samples deals of the other tiles,
+    the hand sitting at seat sample % 4'''
+    games = len(masks) * samples
+    held = np.repeat(masks, samples)
+    # sort the held tiles first and the others in a random order, as
+    # vectorized.deal does, and deal the others to the remaining seats
+    keys = rng.integers(0, 1 << 26, (games, tiles.NTILES), dtype=np.int32)
+    keys <<= 5
+    index = np.arange(tiles.NTILES, dtype=np.int32)
+    keys |= index
+    keys = np.where(held[:, None] >> index & 1, index - 32, keys)
+    keys.sort(axis=1)
+    bits = np.left_shift(1, keys & 31, dtype=np.int32)
+    dealt = bits.reshape(games, SEATS, HAND).sum(axis=2, dtype=np.int32)
+
+    seat = np.tile(np.arange(samples) % SEATS, len(masks))
+    order = (np.arange(SEATS)[None, :] - seat[:, None]) % SEATS
+    hands = dealt[np.arange(games)[:, None], order]
+    won = vectorized.play(hands).winner == seat
+    return won.reshape(len(masks), samples).mean(axis=1, dtype=np.float64)
+
+
+def build_range(job):
+    '''Records of the hands of ranks [start, stop) as bytes'''
+    start, stop, samples, seed = job
+    masks = hand_masks(start, stop)
+    records = np.zeros(stop - start, dtype=[('pips', 'u1'), ('doubles', 'u1'),
+                                            ('longest', 'u1'), ('suits', 'u1'),
+                                            ('equity', '<f4')])
+    records['pips'], records['doubles'], records['longest'], records['suits'] = \
+        features(masks)
+    # seeded by the range, the table does not depend on the number of workers
+    records['equity'] = equity(masks, samples, np.random.default_rng((seed, start)))
+    return start, records.tobytes()
+
+
+def build(path, samples=64, seed=0, workers=None, chunksize=CHUNK, verbose=False):
+    '''Write the table of every hand to path, ranges of chunksize ranks are
+    built on a pool of workers (default one per core).  samples has to be a
+    multiple of 4 so every hand plays as often from each seat'''
+    if np is None:
+        raise RuntimeError('building a hand table needs numpy')
+    if samples <= 0 or samples % SEATS:
+        raise ValueError('samples has to be a positive multiple of {}'.format(SEATS))
+    jobs = [(start, min(start + chunksize, HANDS), samples, seed)
+            for start in range(0, HANDS, chunksize)]
+    # built next to path and only moved there once every range is written,
+    # so a build that stops leaves no table that looks complete
+    partial = path + '.tmp'
+    pool = None
+    try:
+        with open(partial, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, HANDS, samples, seed))
+            f.truncate(HEADER.size + HANDS * RECORD.size)
+            begin = time.time()
+            if workers == 1:
+                results = map(build_range, jobs)
+            else:
+                pool = multiprocessing.Pool(workers)
+                results = pool.imap_unordered(build_range, jobs)
+            for done, (start, data) in enumerate(results, 1):
+                f.seek(HEADER.size + start * RECORD.size)
+                f.write(data)
+                if verbose and done % 32 == 0:
+                    print('{}/{} ranges, {:.0f}s'.format(done, len(jobs),
+                                                         time.time() - begin))
+        if pool is not None:
+            pool.close()
+            pool.join()
+            pool = None
+        os.replace(partial, path)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        if os.path.exists(partial):
+            os.remove(partial)
+
+
+class HandTable(object):
+    '''The values of any hand from a table file mapped into memory'''
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, hands, self.samples, self.seed = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION or hands != HANDS or \
+                len(self.map) != HEADER.size + HANDS * RECORD.size:
+            raise ValueError('{} is not a version {} hand table'.format(path, VERSION))
+
+    def __len__(self):
+        return HANDS
+
+    def __getitem__(self, r):
+        '''HandValues of the hand of rank r'''
+        r = operator.index(r)
+        if not 0 <= r < HANDS:
+            raise IndexError('hand rank {} out of range'.format(r))
+        return HandValues(*RECORD.unpack_from(self.map, HEADER.size + r * RECORD.size))
+
+    def lookup(self, hand):
+        '''HandValues of a hand, a bitmask or a list of pairs'''
+        return self[rank(hand)]
+
+    def equity(self, hand):
+        return EQUITY.unpack_from(self.map, HEADER.size + rank(hand) * RECORD.size +
+                                  EQUITY_OFFSET)[0]
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Build or read the table of all 7 tile hands')
+    sub = ap.add_subparsers(dest='command')
+    b = sub.add_parser('build', help='Build a table')
+    b.add_argument('path', action='store')
+    b.add_argument('--samples', '-n', action='store', type=int, default=64,
+                   help='Deals played per hand for its equity, a multiple of 4')
+    b.add_argument('--seed', '-s', action='store', type=int, default=0)
+    b.add_argument('--workers', '-w', action='store', type=int, default=None,
+                   help='Number of processes, default one per core')
+    s = sub.add_parser('show', help='Show the values of hands')
+    s.add_argument('path', action='store')
+    s.add_argument('hand', nargs='+', help='Tiles of a hand as i,j pairs')
+    args = ap.parse_args()
+
+    if args.command == 'build':
+        if args.samples <= 0 or args.samples % SEATS:
+            ap.error('--samples has to be a positive multiple of {}'.format(SEATS))
+        start = time.time()
+        build(args.path, args.samples, args.seed, args.workers, verbose=True)
+        print('{} hands in {:.0f}s, {} bytes'.format(HANDS, time.time() - start,
+                                                     os.path.getsize(args.path)))
+    elif args.command == 'show':
+        hand = [tuple(int(p) for p in t.split(',')) for t in args.hand]
+        with HandTable(args.path) as table:
+            print('rank {}: {}'.format(rank(hand), table.lookup(hand)))
+    else:
+        ap.print_help()
+
+
+if __name__ == '__main__':
+    main()
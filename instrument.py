@@ -0,0 +1,114 @@
+'''Optional timers and counters on the phases of a doublesix game
+
+While enabled, an Instruments object replaces Game.deal, Player.play (and
+the play of every Player subclass that has its own) and Board.putdown with
+wrappers that count the calls and add up their time.  Disabling puts the
+original functions back, so the engine runs exactly as before and turning
+the instruments off costs nothing.
+
+    with Instruments() as inst:
+        simulate.simulate(1000, workers=1)
+    print(inst.report())
+
+Only the process the instruments are enabled in is measured, play games
+with workers=1 to see them.
+'''
+from __future__ import print_function
+import collections
+import time
+
+from doublesix import Player, Board, Game
+
+# phase name, class and method timed
+PHASES = (
+    ('deal', Game, 'deal'),
+    ('select', Player, 'play'),
+    ('putdown', Board, 'putdown'),
+)
+
+
+def _subclasses(cls):
+    result = [cls]
+    for sub in cls.__subclasses__():
+        result.extend(_subclasses(sub))
+    return result
+
+
+class Instruments(object):
+    def __init__(self):
+        self.calls = collections.Counter()
+        self.seconds = collections.Counter()
+        self._saved = []
+        self._active = set()
+
+    @property
+    def enabled(self):
+        return bool(self._saved)
+
+    def _timed(self, phase, function):
+        calls = self.calls
+        seconds = self.seconds
+        clock = time.perf_counter
+        active = self._active
+
+        def timed(*args, **kwargs):
+            # a subclass calling the method it overrides is one call
+            if phase in active:
+                return function(*args, **kwargs)
+            active.add(phase)
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                seconds[phase] += clock() - start
+                calls[phase] += 1
+                active.discard(phase)
+        timed.__wrapped__ = function
+        timed.__doc__ = function.__doc__
+        return timed
+
+    def enable(self):
+        if self.enabled:
+            return self
+        for phase, base, name in PHASES:
+            for cls in _subclasses(base):
+                function = cls.__dict__.get(name)
+                if function is not None:
+                    self._saved.append((cls, name, function))
+                    setattr(cls, name, self._timed(phase, function))
+        return self
+
+    def disable(self):
+        for cls, name, function in reversed(self._saved):
+            setattr(cls, name, function)
+        self._saved = []
+
+    def reset(self):
+        self.calls.clear()
+        self.seconds.clear()
+
+    def __enter__(self):
+        return self.enable()
+
+    def __exit__(self, *exc):
+        self.disable()
+
+    def results(self):
+        '''{phase: {'calls', 'seconds', 'us_per_call'}} of every phase'''
+        results = {}
+        for phase, base, name in PHASES:
+            calls = self.calls[phase]
+            seconds = self.seconds[phase]
+            results[phase] = {
+                'calls': calls,
+                'seconds': seconds,
+                'us_per_call': seconds / calls * 1e6 if calls else 0.0,
+            }
+        return results
+
+    def report(self):
+        lines = ['{:8} {:>10} {:>10} {:>8}'.format('phase', 'calls', 'seconds', 'us/call')]
+        for phase, r in sorted(self.results().items()):
+            lines.append('{:8} {:10d} {:10.3f} {:8.2f}'.format(
+                phase, r['calls'], r['seconds'], r['us_per_call']))
+        return '\n'.join(lines)
@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 from __future__ import unicode_literals, print_function
 import argparse
+import gzip
 import os
 import sys
+import zipfile
 import xml.etree.ElementTree as ET
 
 GROUP = 'g'
@@ -10,6 +12,10 @@ CIRCLE = 'circle'
 STYLE = 'style'
 LINE = 'line'
 RECT = 'rect'
+DEFS = 'defs'
+SYMBOL = 'symbol'
+USE = 'use'
+SVGNS = 'http://www.w3.org/2000/svg'
 
 DWIDTH = 96
 DHEIGHT = 192
@@ -123,6 +129,47 @@ class DominoSVG(object):
                 ET.SubElement(tilegrp, CIRCLE, r=str(DPIPRADIUS),
                               cx=str(pip[0]), cy=str(pip[1]), attrib=attrib)
 
+SPRITE_FRAME = 'frame'
+SPRITE_PIPS = 'pips-{}'
+SPRITE_TILE = 'domino-{}-{}'
+
+def sprite_svg(fg='0,0,0', bg='255,255,255', css_styles=True):
+    '''One svg holding every domino as a symbol, e.g. #domino-1-3.  The frame
+    and the seven half faces are symbols too and the dominoes are made of
+    <use> references to them'''
+    tilebox = '0 0 {} {}'.format(DWIDTH + 2*DBORDER, DHEIGHT + 2*DBORDER)
+    halfbox = '0 0 {0} {0}'.format(DWIDTH)
+    svg = ET.Element('svg', xmlns=SVGNS)
+    if css_styles:
+        ET.SubElement(svg, STYLE).text = css_def(fg=fg, bg=bg)
+    defs = ET.SubElement(svg, DEFS)
+
+    frame = ET.SubElement(defs, SYMBOL, id=SPRITE_FRAME, viewBox=tilebox)
+    ET.SubElement(frame, RECT, x='5', y='5',
+                  width=str(DWIDTH), height=str(DHEIGHT),
+                  attrib=styles(css_styles, RECTCLASS, RECTSTYLE, fg=fg, bg=bg))
+    ET.SubElement(frame, LINE, x1='11', y1='101', x2='95', y2='101',
+                  attrib=styles(css_styles, LINECLASS, LINESTYLE, fg=fg))
+
+    pipattrib = styles(css_styles, PIPCLASS, PIPSTYLE, fg=fg)
+    for number, pips in enumerate(PIP_LAYOUT):
+        half = ET.SubElement(defs, SYMBOL, id=SPRITE_PIPS.format(number),
+                             viewBox=halfbox)
+        for pip in pips:
+            ET.SubElement(half, CIRCLE, r=str(DPIPRADIUS),
+                          cx=str(pip[0]), cy=str(pip[1]), attrib=pipattrib)
+
+    for i in range(7):
+        for j in range(i, 7):
+            tile = ET.SubElement(defs, SYMBOL, id=SPRITE_TILE.format(i, j),
+                                 viewBox=tilebox)
+            ET.SubElement(tile, USE, href='#' + SPRITE_FRAME)
+            for transform, number in ((TOP, i), (BOTTOM, j)):
+                ET.SubElement(tile, USE, href='#' + SPRITE_PIPS.format(number),
+                              transform=transform,
+                              width=str(DWIDTH), height=str(DWIDTH))
+    return svg
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument('--python', action='store_true',
@@ -132,37 +179,158 @@ def main():
     ap.add_argument('--background', '-b', action='store', default='255,255,255')
     ap.add_argument('--matrix', '-m', action='store', default='',
                     help='Elements of a 2d transformation, e.g "1,0,0,1,0,0"')
+    ap.add_argument('--compact', action='store_true',
+                    help='With --python, build the dominoes from templates on first use')
+    ap.add_argument('--sprite', action='store_true',
+                    help='Generate one sprite sheet with a <symbol> per domino, ignore matrix')
+    ap.add_argument('--archive', action='store_true',
+                    help='Write the output as one compressed file, '
+                    'dominoes.zip or with --sprite dominoes-sprite.svgz')
     args = ap.parse_args()
 
+    if not os.path.exists(args.dir):
+        os.makedirs(args.dir)
+
+    if args.sprite:
+        mksprite(outdir=args.dir, fg=args.foreground, bg=args.background,
+                 archive=args.archive)
+        return
+
     fg = '{fg}' if args.python else args.foreground
     bg = '{bg}' if args.python else args.background
     matrix = '{matrix}' if args.python else args.matrix
     dominoes = [DominoSVG(i, j, fg=fg, bg=bg, matrix=matrix, css_styles=True)
                  for i in range(7) for j in range(i, 7)]
 
-    if not os.path.exists(args.dir):
-        os.makedirs(args.dir)
-
     if args.python:
-        mkpython(dominoes, css_styles=True, outdir=args.dir)
+        mkpython(dominoes, css_styles=True, outdir=args.dir, compact=args.compact)
+    elif args.archive:
+        mkarchive(dominoes, outdir=args.dir, css=css_def(fg=fg, bg=bg))
     else:
         with open(os.path.join(args.dir,'dominoes.css'), 'w') as f:
             f.write(css_def(fg=fg, bg=bg))
         mkfiles(dominoes, outdir=args.dir)
 
 
+def svgfile(d):
+    '''File name and contents of a domino written as its own SVG file'''
+    return ('{}_{}.svg'.format(*d.dtuple),
+            ET.tostring(indent(d.svg), encoding='utf-8', xml_declaration=True))
+
+
 def mkfiles(dominoes, outdir='.'):
     '''Write the dominoes as individual SVG files'''
 
     for d in dominoes:
-        ofile = os.path.join(outdir, '{}_{}.svg'.format(*d.dtuple))
-        with open(ofile, 'w') as f:
-            t = ET.ElementTree(element=indent(d.svg))
-            t.write(f, encoding='utf-8', xml_declaration=True)
+        name, data = svgfile(d)
+        with open(os.path.join(outdir, name), 'wb') as f:
+            f.write(data)
 
 
-def mkpython(dominoes, module='dominoes', outdir='.', css_styles=True):
-    '''Write the dominoes as constants in a module named dominoes'''
+def mkarchive(dominoes, outdir='.', css=None, name='dominoes.zip'):
+    '''Write the individual SVG files, and the css, into one zip file'''
+    with zipfile.ZipFile(os.path.join(outdir, name), 'w',
+                         zipfile.ZIP_DEFLATED) as z:
+        if css is not None:
+            z.writestr('dominoes.css', css)
+        for d in dominoes:
+            z.writestr(*svgfile(d))
+
+
+def mksprite(outdir='.', fg='0,0,0', bg='255,255,255', css_styles=True,
+             archive=False, name='dominoes-sprite'):
+    '''Write every domino into one sprite sheet, gzipped as .svgz for archive'''
+    data = ET.tostring(sprite_svg(fg, bg, css_styles), encoding='utf-8',
+                       xml_declaration=True)
+    if archive:
+        with gzip.open(os.path.join(outdir, name + '.svgz'), 'wb') as f:
+            f.write(data)
+    else:
+        with open(os.path.join(outdir, name + '.svg'), 'wb') as f:
+            f.write(data)
+
+
+# the code of a compact module after its templates, see mkpython
+COMPACT_SVG_DICT = '''
+_KEYSET = frozenset(_KEYS)
+
+
+def _half(transform, number):
+    pips = PIP_LAYOUT[number]
+    if not pips:
+        return ''
+    return GROUP_HEAD % transform + ''.join([PIP % pip for pip in pips]) + GROUP_TAIL
+
+
+class _SvgDict(object):
+    \'\'\'The SVG_DICT of a full module, a domino is put together on first use.
+    Not a collections.abc.Mapping, importing collections would cost more
+    than the whole module\'\'\'
+    def __init__(self):
+        self._svg = {}
+
+    def __getitem__(self, dtuple):
+        svg = self._svg.get(dtuple)
+        if svg is None:
+            if dtuple not in _KEYSET:
+                raise KeyError(dtuple)
+            svg = FRAME_HEAD + _half(TOP, dtuple[0]) + _half(BOTTOM, dtuple[1]) + FRAME_TAIL
+            self._svg[dtuple] = svg
+        return svg
+
+    def get(self, dtuple, default=None):
+        return self[dtuple] if dtuple in _KEYSET else default
+
+    def __contains__(self, dtuple):
+        return dtuple in _KEYSET
+
+    def __iter__(self):
+        return iter(_KEYS)
+
+    def __len__(self):
+        return len(_KEYS)
+
+    def keys(self):
+        return list(_KEYS)
+
+    def values(self):
+        return [self[k] for k in _KEYS]
+
+    def items(self):
+        return [(k, self[k]) for k in _KEYS]
+
+
+SVG_DICT = _SvgDict()
+'''
+
+def compact_templates(dominoes, css_styles=True):
+    '''Templates a compact module assembles the dominoes from: the frame,
+    that is the serialized (0, 0), and a pip group'''
+    frame = ET.tostring(dominoes[0].svg).decode('utf-8')
+    tail = '</{0}></svg>'.format(GROUP)
+    assert dominoes[0].dtuple == (0, 0) and frame.endswith(tail)
+    attrib = styles(css_styles, PIPCLASS, PIPSTYLE, fg='{fg}')
+    grp = ET.Element(GROUP, transform='%s')
+    ET.SubElement(grp, CIRCLE, r=str(DPIPRADIUS), cx='%d', cy='%d', attrib=attrib)
+    group_head, pip = ET.tostring(grp).decode('utf-8').split('>', 1)
+    pip, group_tail = pip.rsplit('<', 1)
+    return [
+        ('FRAME_HEAD', frame[:-len(tail)]),
+        ('FRAME_TAIL', tail),
+        ('GROUP_HEAD', group_head + '>'),
+        ('GROUP_TAIL', '<' + group_tail),
+        ('PIP', pip),
+        ('TOP', TOP),
+        ('BOTTOM', BOTTOM),
+        ('PIP_LAYOUT', PIP_LAYOUT),
+        ('_KEYS', tuple(d.dtuple for d in dominoes)),
+        ]
+
+
+def mkpython(dominoes, module='dominoes', outdir='.', css_styles=True, compact=False):
+    '''Write the dominoes as constants in a module named dominoes.  A compact
+    module holds a frame template and the pip layouts instead of the 28
+    strings and puts each domino together the first time it is used'''
     ofile = os.path.join(outdir, '{}.py'.format(module))
     with open(ofile, 'w') as f:
         f.write("DWIDTH = {}\n".format(DWIDTH))
@@ -170,12 +338,25 @@ def mkpython(dominoes, module='dominoes', outdir='.', css_styles=True):
         # write some rotation matrixes
         f.write("M2d_IDENTITY = '1, 0, 0, 1, 0, 0'\n")
         f.write("M2d_ROTLEFT = '0, -1, 1, 0, 0, {}'\n".format(DWIDTH+2*DBORDER))
-        f.write("M2d_ROTRIGHT = '0, 1, -1, 0, 0, {}'\n".format(DHEIGHT+2*DBORDER ))
-        f.write("SVG_DICT = dict( (\n")
-        for d in dominoes:
-            f.write("    ({}, '''{}'''),\n".format(
-                d.dtuple, ET.tostring(d.svg).decode('utf-8')))
-        f.write("    )\n")
+        f.write("M2d_ROTRIGHT = '0, 1, -1, 0, {}, 0'\n".format(DHEIGHT+2*DBORDER ))
+        if compact:
+            code = ''.join('{} = {!r}\n'.format(name, value) for name, value
+                           in compact_templates(dominoes, css_styles))
+            code += COMPACT_SVG_DICT
+            # the dominoes have to come out exactly as in a full module
+            namespace = {}
+            exec(code, namespace)
+            for d in dominoes:
+                if namespace['SVG_DICT'][d.dtuple] != ET.tostring(d.svg).decode('utf-8'):
+                    raise RuntimeError('compact module draws domino {} differently'
+                                       .format(d.dtuple))
+            f.write(code)
+        else:
+            f.write("SVG_DICT = dict( (\n")
+            for d in dominoes:
+                f.write("    ({}, '''{}'''),\n".format(
+                    d.dtuple, ET.tostring(d.svg).decode('utf-8')))
+            f.write("    ))\n")
         if css_styles:
             f.write("DOMINO_CSS = '''{}'''\n".format(
                 css_def(fg='0,0,0',bg='255,255,255')))
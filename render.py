@@ -0,0 +1,66 @@
+'''Serialized SVG of dominoes from a bounded LRU cache
+
+Redrawing a board asks for the same few tiles over and over, so a
+TileRenderer keeps the serialized SVG of the last tiles it rendered.  On a
+miss it fills in the pre-serialized template of the generated dominoes
+module when that fits (css classes and a transform matrix) and otherwise
+builds the tile with mkdom.DominoSVG.
+'''
+from __future__ import unicode_literals
+import collections
+import xml.etree.ElementTree as ET
+
+from mkdom import DominoSVG
+
+try:
+    from dominoes import SVG_DICT
+except ImportError:
+    # not generated yet, see mkdom.py --python
+    SVG_DICT = {}
+
+CacheInfo = collections.namedtuple('CacheInfo', 'hits misses maxsize currsize')
+
+
+class TileRenderer(object):
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = collections.OrderedDict()
+
+    def render(self, tile, fg='0,0,0', bg='255,255,255', matrix='', css_styles=False):
+        '''SVG text of the domino tile, a pair of pips in either order'''
+        i, j = tile
+        dtuple = (i, j) if i < j else (j, i)
+        key = (dtuple, fg, bg, matrix, css_styles)
+        cache = self._cache
+        svg = cache.get(key)
+        if svg is not None:
+            self.hits += 1
+            cache.move_to_end(key)
+            return svg
+
+        self.misses += 1
+        svg = self._build(dtuple, fg, bg, matrix, css_styles)
+        cache[key] = svg
+        if len(cache) > self.maxsize:
+            cache.popitem(last=False)
+        return svg
+
+    @staticmethod
+    def _build(dtuple, fg, bg, matrix, css_styles):
+        # the templates use css classes, so the colors are up to the
+        # stylesheet, and always carry a transform
+        template = SVG_DICT.get(dtuple)
+        if template is not None and css_styles and matrix:
+            return template.format(matrix=matrix)
+        d = DominoSVG(dtuple[0], dtuple[1], fg=fg, bg=bg, matrix=matrix,
+                      css_styles=css_styles)
+        return ET.tostring(d.svg).decode('utf-8')
+
+    def cache_info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+    def clear(self):
+        self._cache.clear()
+        self.hits = self.misses = 0
@@ -0,0 +1,198 @@
+'''A doublesix.Board drawn as one SVG, updated a play at a time
+
+The chain is laid out in rows from the first tile: doubles stand upright,
+the other tiles are turned with M2d_ROTLEFT or M2d_ROTRIGHT so their pips
+read along the chain.  When an end of the chain reaches the wrap width it
+turns: the tile at the turn stands upright past the end of the row, the
+next tile lies across its far end (a double turned with M2d_ROTLEFT) and
+the chain carries on in the other direction, the right end of the chain
+in rows below the first, the left end in rows above.
+
+BoardScene.update() looks at the plays made on the board since the last
+call and returns a Diff per change, carrying only the element of the tile
+that was added (or the id of one that was undone) and the new viewBox, so
+the cost of a move does not grow with the chain.
+'''
+from __future__ import unicode_literals
+import collections
+
+import tiles
+from doublesix import LEFT
+from dominoes import (DWIDTH, DHEIGHT, M2d_IDENTITY, M2d_ROTLEFT, M2d_ROTRIGHT,
+                      DOMINO_CSS)
+from mkdom import DBORDER
+from render import TileRenderer
+
+# size of a tile with its border, standing up
+TILE_W = DWIDTH + 2 * DBORDER
+TILE_H = DHEIGHT + 2 * DBORDER
+# a standing tile turned upside down, the higher number on top
+M2d_ROT180 = '-1, 0, 0, -1, {}, {}'.format(TILE_W, TILE_H)
+
+# rows are TILE_H high, a tile lying in a row is centered on it
+LYING_Y = (TILE_H - TILE_W) // 2
+# the tile at a turn has the half next to the row centered on the row
+TURN_Y = TILE_H // 4
+# rows of an end of the chain after each turn, the tile lying across the
+# turn touches its far end
+ROW_PITCH = TURN_Y + TILE_H - LYING_Y
+# the first tile, a turn and the tile across it have to fit
+MIN_WIDTH = 2 * TILE_H + TILE_W
+WRAP_WIDTH = 8 * TILE_H
+
+Diff = collections.namedtuple('Diff', 'op id svg viewbox')
+Placed = collections.namedtuple('Placed', 'entry id state')
+# how an end of the chain grows: hdir +1 to the right, -1 to the left,
+# vdir the way it turns, edge the x the next tile goes against in row y,
+# turn the x of the tile at a turn the next tile lies across (else None)
+Arm = collections.namedtuple('Arm', 'hdir vdir edge y turn')
+
+SVG_OPEN = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="{}"><style>{}</style>'
+SVG_CLOSE = '</svg>'
+
+
+def inner_svg(svg):
+    '''The content of an svg document, without the svg element itself'''
+    return svg[svg.index('>') + 1:svg.rindex('</svg>')]
+
+
+def lying(left, right):
+    '''Matrix of a tile lying in a row showing left and right pips'''
+    # M2d_ROTLEFT puts the lower number on the left
+    return M2d_ROTLEFT if left <= right else M2d_ROTRIGHT
+
+
+class BoardScene(object):
+    def __init__(self, board, renderer=None, width=WRAP_WIDTH):
+        '''width is where the chain turns, None keeps it on one row'''
+        if width is not None and width < MIN_WIDTH:
+            raise ValueError('a scene needs a width of at least {}'.format(MIN_WIDTH))
+        self.board = board
+        self.renderer = renderer or TileRenderer()
+        self.width = width
+        self.elements = collections.OrderedDict()
+        self.placed = []
+        # the ends of the chain as Arms, LEFT and RIGHT, the x the rows
+        # turn at and the box around the tiles as (x0, y0, x1, y1)
+        self.arms = None
+        self.bounds = None
+        self.box = None
+        self.count = 0
+
+    def viewbox(self):
+        if self.box is None:
+            return '0 0 {} {}'.format(TILE_W, TILE_H)
+        x0, y0, x1, y1 = self.box
+        return '{} {} {} {}'.format(x0, y0, x1 - x0, y1 - y0)
+
+    def update(self):
+        '''Bring the scene up to date with the board, returns a Diff for
+        every tile removed (undone) or added since the last update'''
+        history = self.board.history
+        placed = self.placed
+        diffs = []
+        while placed and (len(placed) > len(history) or
+                          history[len(placed) - 1] is not placed[-1].entry):
+            p = placed.pop()
+            self.arms, self.bounds, self.box = p.state
+            del self.elements[p.id]
+            diffs.append(Diff('remove', p.id, None, self.viewbox()))
+        for entry in history[len(placed):]:
+            diffs.append(self._add(entry))
+        return diffs
+
+    def _add(self, entry):
+        n, side, left, right = entry
+        i, j = self.board_tile(entry)
+        state = (self.arms, self.bounds, self.box)
+        if left is None:
+            x, y, w, h, matrix = self._first(i, j)
+        else:
+            # the pip against the chain and the pip left open
+            near, far = (j, i) if side == LEFT else (i, j)
+            x, y, w, h, matrix, arm = self._place(self.arms[side], near, far)
+            arms = list(self.arms)
+            arms[side] = arm
+            self.arms = tuple(arms)
+        if self.box is None:
+            self.box = (x, y, x + w, y + h)
+        else:
+            x0, y0, x1, y1 = self.box
+            self.box = (min(x0, x), min(y0, y), max(x1, x + w), max(y1, y + h))
+
+        self.count += 1
+        id = 'play-{}'.format(self.count)
+        tile = self.renderer.render((i, j), matrix=matrix, css_styles=True)
+        element = '<g id="{}" transform="translate({}, {})">{}</g>'.format(
+            id, x, y, inner_svg(tile))
+        self.elements[id] = element
+        self.placed.append(Placed(entry, id, state))
+        return Diff('add', id, element, self.viewbox())
+
+    def _first(self, i, j):
+        if i == j:
+            x, y, w, h, matrix = 0, 0, TILE_W, TILE_H, M2d_IDENTITY
+        else:
+            x, y, w, h, matrix = 0, LYING_Y, TILE_H, TILE_W, lying(i, j)
+        self.arms = (Arm(-1, -1, 0, 0, None), Arm(1, 1, w, 0, None))
+        if self.width is None:
+            self.bounds = (float('-inf'), float('inf'))
+        else:
+            self.bounds = (w // 2 - self.width // 2, w // 2 + self.width // 2)
+        return x, y, w, h, matrix
+
+    def _place(self, arm, near, far):
+        '''Position, size and matrix of a tile put on an end of the chain
+        and the end after it'''
+        hdir, vdir, edge, row, turn = arm
+        double = near == far
+        # the pips as they show from left to right in the row
+        shown = (near, far) if hdir > 0 else (far, near)
+
+        if turn is not None:
+            # across the far end of the tile at the turn, a double centered
+            # on it and any other tile with its near half against it
+            if double:
+                x = turn + TILE_W // 2 - TILE_H // 2
+            elif hdir > 0:
+                x = turn
+            else:
+                x = turn + TILE_W - TILE_H
+            edge = x + TILE_H if hdir > 0 else x
+            return (x, row + LYING_Y, TILE_H, TILE_W, lying(*shown),
+                    Arm(hdir, vdir, edge, row, None))
+
+        w = TILE_W if double else TILE_H
+        low, high = self.bounds
+        if (edge + w <= high) if hdir > 0 else (edge - w >= low):
+            x = edge if hdir > 0 else edge - w
+            edge = x + w if hdir > 0 else x
+            if double:
+                return x, row, TILE_W, TILE_H, M2d_IDENTITY, Arm(hdir, vdir, edge, row, None)
+            return (x, row + LYING_Y, TILE_H, TILE_W, lying(*shown),
+                    Arm(hdir, vdir, edge, row, None))
+
+        # turn: stand the tile past the end of the row, the near pip
+        # against the row, and go on in the other direction a row further
+        x = edge if hdir > 0 else edge - TILE_W
+        y = row + TURN_Y if vdir > 0 else row - TURN_Y
+        top, bottom = (near, far) if vdir > 0 else (far, near)
+        matrix = M2d_IDENTITY if top <= bottom else M2d_ROT180
+        return (x, y, TILE_W, TILE_H, matrix,
+                Arm(-hdir, vdir, None, row + vdir * ROW_PITCH, x))
+
+    @staticmethod
+    def board_tile(entry):
+        '''Pips of a played tile in the order they show along the chain'''
+        n, side, left, right = entry
+        i, j = tiles.TILES[n]
+        if left is None:
+            return i, j
+        if side == LEFT:
+            return (j if i == left else i), left
+        return right, (j if i == right else i)
+
+    def svg(self):
+        '''The whole board as one svg document'''
+        return ''.join([SVG_OPEN.format(self.viewbox(), DOMINO_CSS)] +
+                       list(self.elements.values()) + [SVG_CLOSE])
@@ -0,0 +1,372 @@
+'''A doublesix Player that picks its tiles by searching ahead
+
+The hidden hands are sampled ("determinized") consistently with what the
+player can see: the tiles not in its hand and not on the board, how many
+tiles each opponent holds and the tiles an opponent has passed on.  Every
+sample is searched as a perfect information game with paranoid alpha-beta
+(everybody else plays against us) and the values of each of our moves are
+averaged over the samples.  Positions are cached in a bounded transposition
+table keyed by a Zobrist hash that is updated incrementally on every move.
+
+Moves follow the rule of Board.putdown: a tile goes on the left end if it
+matches it, otherwise on the right.
+'''
+from __future__ import print_function
+import random
+import time
+
+import tiles
+from doublesix import Player, Board
+
+INF = float('inf')
+WIN = 1.0
+LOSS = -1.0
+EMPTY = 7  # end "value" of an empty board in the hash keys
+
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+
+class Zobrist(object):
+    '''Random 64 bit keys for every part of a position'''
+    def __init__(self, seats=4, seed=0x5eed):
+        rng = random.Random(seed)
+        bits = lambda: rng.getrandbits(64)
+        self.hand = [[bits() for n in range(tiles.NTILES)] for s in range(seats)]
+        self.left = [bits() for v in range(EMPTY + 1)]
+        self.right = [bits() for v in range(EMPTY + 1)]
+        self.turn = [bits() for s in range(seats)]
+        self.passes = [bits() for p in range(seats + 1)]
+
+    def key(self, hands, board, turn, passes):
+        '''Hash of a position from scratch, searches update it incrementally'''
+        k = self.turn[turn] ^ self.passes[passes]
+        k ^= self.left[EMPTY if board.left is None else board.left]
+        k ^= self.right[EMPTY if board.right is None else board.right]
+        for seat, hand in enumerate(hands):
+            for n in tiles.indices(hand):
+                k ^= self.hand[seat][n]
+        return k
+
+ZOBRIST = Zobrist()
+
+
+class TranspositionTable(object):
+    '''Map of hash key to (depth, bound, value) in a fixed number of slots,
+    a power of two, indexed by the low bits of the key.  A slot holding
+    another position is only taken over by a search at least as deep or
+    when it was stored before the last new_search(), so every put costs
+    the same however full the table is'''
+    def __init__(self, size=1 << 18):
+        self.size = 1 << max(size - 1, 0).bit_length()
+        self.mask = self.size - 1
+        self.keys = [None] * self.size
+        self.entries = [None] * self.size
+        self.ages = [0] * self.size
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+
+    def get(self, key):
+        self.probes += 1
+        i = key & self.mask
+        if self.keys[i] == key:
+            self.hits += 1
+            return self.entries[i]
+        return None
+
+    def put(self, key, entry):
+        i = key & self.mask
+        stored = self.keys[i]
+        if (stored is None or stored == key or self.ages[i] != self.generation or
+                entry[0] >= self.entries[i][0]):
+            self.keys[i] = key
+            self.entries[i] = entry
+            self.ages[i] = self.generation
+
+    def new_search(self):
+        '''Let the entries of earlier searches be replaced by any new one'''
+        self.generation += 1
+
+    def hit_rate(self):
+        return float(self.hits) / self.probes if self.probes else 0.0
+
+    def clear(self):
+        self.keys = [None] * self.size
+        self.entries = [None] * self.size
+        self.ages = [0] * self.size
+        self.generation = 0
+        self.probes = self.hits = 0
+
+
+class OutOfBudget(Exception):
+    pass
+
+
+class Search(object):
+    '''Paranoid alpha-beta over one fully known position, from seat me'''
+    def __init__(self, hands, board, turn, passes, me, table, deadline, node_limit):
+        self.hands = hands
+        self.board = board
+        self.turn = turn
+        self.passes = passes
+        self.me = me
+        self.table = table
+        self.deadline = deadline
+        self.node_limit = node_limit
+        self.nodes = 0
+        self.key = ZOBRIST.key(hands, board, turn, passes)
+
+    def play(self, n):
+        '''Play tile n (None to pass) for the seat to move.  Returns the
+        value of the game if it is over, otherwise None'''
+        z = ZOBRIST
+        board = self.board
+        seat = self.turn
+        nseats = len(self.hands)
+        key = self.key ^ z.turn[seat] ^ z.passes[self.passes]
+        if n is None:
+            self.passes += 1
+            if self.passes == nseats:
+                return self.blocked_value()
+        else:
+            left = board.left
+            right = board.right
+            board.play(n, board.side(n))
+            self.hands[seat] ^= tiles.BIT[n]
+            self.passes = 0
+            key ^= z.hand[seat][n]
+            if left != board.left:
+                key ^= z.left[EMPTY if left is None else left] ^ z.left[board.left]
+            if right != board.right:
+                key ^= z.right[EMPTY if right is None else right] ^ z.right[board.right]
+            if not self.hands[seat]:
+                return WIN if seat == self.me else LOSS
+        self.turn = (seat + 1) % nseats
+        self.key = key ^ z.turn[self.turn] ^ z.passes[self.passes]
+        return None
+
+    def blocked_value(self):
+        pips = [tiles.pips(h) for h in self.hands]
+        return WIN if pips.index(min(pips)) == self.me else LOSS
+
+    def evaluate(self):
+        '''Value of an unfinished position: how far ahead we are in tiles'''
+        counts = [tiles.count(h) for h in self.hands]
+        mine = counts[self.me]
+        others = float(sum(counts) - mine) / (len(counts) - 1)
+        return 0.5 * (others - mine) / 7
+
+    def search(self, depth, alpha, beta):
+        self.nodes += 1
+        if self.nodes >= self.node_limit or (
+                not self.nodes & 0xff and time.perf_counter() > self.deadline):
+            raise OutOfBudget()
+
+        table = self.table
+        key = self.key
+        entry = table.get(key)
+        if entry is not None and entry[0] >= depth:
+            bound, value = entry[1], entry[2]
+            if bound == EXACT:
+                return value
+            if bound == LOWER and value >= beta:
+                return value
+            if bound == UPPER and value <= alpha:
+                return value
+        if depth == 0:
+            return self.evaluate()
+
+        seat = self.turn
+        maximize = seat == self.me
+        legal = self.hands[seat] & self.board.playable()
+        moves = tiles.indices(legal)
+        moves.reverse()
+        if not moves:
+            moves = [None]
+
+        alpha0 = alpha
+        beta0 = beta
+        best = -INF if maximize else INF
+        turn = self.turn
+        passes = self.passes
+        for n in moves:
+            value = self.play(n)
+            if value is None:
+                value = self.search(depth - 1, alpha, beta)
+            self.undo(n, turn, passes, key)
+            if maximize:
+                if value > best:
+                    best = value
+                alpha = max(alpha, best)
+            else:
+                if value < best:
+                    best = value
+                beta = min(beta, best)
+            if alpha >= beta:
+                break
+
+        if best <= alpha0:
+            bound = UPPER
+        elif best >= beta0:
+            bound = LOWER
+        else:
+            bound = EXACT
+        table.put(key, (depth, bound, best))
+        return best
+
+    def undo(self, n, turn, passes, key):
+        if n is not None:
+            self.board.undo()
+            self.hands[turn] ^= tiles.BIT[n]
+        self.turn = turn
+        self.passes = passes
+        self.key = key
+
+
+class SearchPlayer(Player):
+    '''Player choosing moves with a time or node budget per move.
+
+    stats holds the figures of the last move (nodes, seconds, nodes per
+    second, samples searched, forced when the move or pass needed no
+    search) and totals the transposition table use.
+    '''
+    def __init__(self, name, time_budget=0.05, node_budget=None, depth=8,
+                 table_size=1 << 18, seed=None):
+        Player.__init__(self, name)
+        if not (time_budget and time_budget > 0) and not (node_budget and node_budget > 0):
+            raise ValueError('a SearchPlayer needs a positive time_budget or node_budget')
+        self.time_budget = time_budget
+        self.node_budget = node_budget
+        self.depth = depth
+        self.table = TranspositionTable(table_size)
+        self.rng = random.Random(seed)
+        self.stats = {}
+        self.total_nodes = 0
+        self.total_seconds = 0.0
+
+    def play(self, board=None):
+        if board is None or self.game is None:
+            return Player.play(self, board)
+        legal = self.hand & board.playable()
+        if not legal:
+            self.forced()
+            return None
+        n = legal.bit_length() - 1
+        if legal != tiles.BIT[n]:
+            n = self.choose(board, tiles.indices(legal))
+        else:
+            self.forced()
+        self.hand ^= tiles.BIT[n]
+        return tiles.TILES[n]
+
+    def forced(self):
+        '''stats of a move made without searching'''
+        self.stats = {'nodes': 0, 'seconds': 0.0, 'nps': 0.0, 'samples': 0,
+                      'probes': 0, 'hits': 0, 'forced': True}
+
+    def choose(self, board, moves):
+        '''Tile index of the best of the legal moves'''
+        start = time.perf_counter()
+        deadline = start + self.time_budget if self.time_budget else INF
+        node_limit = self.node_budget or INF
+        game = self.game
+        # searches undo their moves, except when they run out of budget and
+        # then the copy is not used again
+        board = self.copy_board(board)
+        self.table.new_search()
+        probes = self.table.probes
+        hits = self.table.hits
+        totals = dict((n, 0.0) for n in moves)
+        nodes = 0
+        samples = 0
+        try:
+            while nodes < node_limit and time.perf_counter() < deadline:
+                hands = self.sample_hands(board)
+                search = Search(hands, board, self.seat, game.passes, self.seat,
+                                self.table, deadline, node_limit - nodes)
+                values = {}
+                try:
+                    for n in moves:
+                        key = search.key
+                        value = search.play(n)
+                        if value is None:
+                            value = search.search(self.depth - 1, -INF, INF)
+                        search.undo(n, self.seat, game.passes, key)
+                        values[n] = value
+                finally:
+                    nodes += search.nodes
+                for n in moves:
+                    totals[n] += values[n]
+                samples += 1
+        except OutOfBudget:
+            pass
+
+        seconds = time.perf_counter() - start
+        self.total_nodes += nodes
+        self.total_seconds += seconds
+        self.stats = {
+            'nodes': nodes,
+            'seconds': seconds,
+            'nps': nodes / seconds if seconds else 0.0,
+            'samples': samples,
+            'probes': self.table.probes - probes,
+            'hits': self.table.hits - hits,
+            'forced': False,
+        }
+        if not samples:
+            return moves[-1]
+        # ties go to the highest tile, like the plain Player
+        return max(reversed(moves), key=lambda n: totals[n])
+
+    def sample_hands(self, board):
+        '''Deal the tiles we cannot see to the other seats, respecting their
+        hand sizes and the tiles they are known not to have'''
+        game = self.game
+        players = game.players
+        hidden = tiles.ALL_TILES ^ self.hand ^ board.played
+        pool = tiles.indices(hidden)
+        counts = [tiles.count(p.hand) for p in players]
+        for attempt in range(20):
+            self.rng.shuffle(pool)
+            hands = [0] * len(players)
+            hands[self.seat] = self.hand
+            remaining = list(counts)
+            for n in pool:
+                bit = tiles.BIT[n]
+                seats = [s for s in range(len(players)) if s != self.seat and
+                         remaining[s] and not bit & game.voids[s]]
+                if not seats:
+                    break
+                s = self.rng.choice(seats)
+                hands[s] |= bit
+                remaining[s] -= 1
+            else:
+                return hands
+
+        # no consistent deal found, ignore what the passes told us
+        hands = [0] * len(players)
+        hands[self.seat] = self.hand
+        i = 0
+        for s in range(len(players)):
+            if s != self.seat:
+                for n in pool[i:i + counts[s]]:
+                    hands[s] |= tiles.BIT[n]
+                i += counts[s]
+        return hands
+
+    def nps(self):
+        '''Nodes per second over all moves so far'''
+        return self.total_nodes / self.total_seconds if self.total_seconds else 0.0
+
+    def report(self):
+        return '{}: {} nodes, {:.0f} nodes/s, table hit rate {:.3f}'.format(
+            self.myname, self.total_nodes, self.nps(), self.table.hit_rate())
+
+    @staticmethod
+    def copy_board(board):
+        copy = Board()
+        for n, side, left, right in board.history:
+            copy.play(n, side)
+        return copy
@@ -0,0 +1,392 @@
+#!/usr/bin/env python
+'''asyncio server hosting many doublesix games over TCP
+
+The protocol is one JSON object per line.  A client sends
+
+    {"op": "join"}                   to be seated at the next table
+    {"op": "play", "tile": [i, j]}   when asked for a move
+
+and receives
+
+    {"op": "start", "table": t, "seat": s, "hand": [[i, j], ...]}
+    {"op": "turn", "ends": [l, r]}   its move, ends is [] on an empty board
+    {"op": "played", "seat": s, "tile": [i, j] or null}   every move at the table
+    {"op": "over", "winner": s, "blocked": false}
+    {"op": "error", "error": "..."}
+
+A seat without a legal tile passes at once.  A seat that does not answer
+within the turn timeout, or has disconnected, plays like a plain Player.
+Every connection has a bounded queue of outgoing lines and a client that
+lets it fill up is disconnected, a player can only have a few moves
+waiting and joins are refused once the table limit is reached.
+
+python server.py --load starts a server and a load generator in the same
+process and reports moves per second and turn latencies.
+'''
+from __future__ import print_function
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+import tiles
+from doublesix import Player, Game
+from simulate import check_seed, game_seed
+
+SEATS = 4
+OUTBOX_SIZE = 256
+INBOX_SIZE = 4
+# put in a player's moves when its client goes away
+DISCONNECTED = object()
+
+log = logging.getLogger(__name__)
+
+
+class Connection(object):
+    '''A client connection, lines are written by their own task'''
+    def __init__(self, server, reader, writer):
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.outbox = asyncio.Queue(OUTBOX_SIZE)
+        self.player = None
+        self.closed = False
+
+    def send(self, msg):
+        if self.closed:
+            return
+        try:
+            self.outbox.put_nowait(json.dumps(msg) + '\n')
+        except asyncio.QueueFull:
+            # the client does not keep up, don't let it hold the server up
+            self.close()
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            if not self.outbox.full():
+                self.outbox.put_nowait(None)
+            self.writer.close()
+            if self.player is not None:
+                self.player.disconnect()
+
+    async def write_lines(self):
+        outbox = self.outbox
+        while not self.closed:
+            line = await outbox.get()
+            if line is None:
+                break
+            lines = [line]
+            while not outbox.empty():
+                line = outbox.get_nowait()
+                if line is None:
+                    break
+                lines.append(line)
+            self.writer.write(''.join(lines).encode('utf-8'))
+            try:
+                await self.writer.drain()
+            except (ConnectionError, OSError):
+                break
+        self.close()
+
+
+class NetworkPlayer(Player):
+    '''Player whose moves come from a connection instead of play()'''
+    def __init__(self, name, connection):
+        Player.__init__(self, name)
+        self.connection = connection
+        self.moves = asyncio.Queue(INBOX_SIZE)
+        self.waiting = False
+        self.timeouts = 0
+
+    def offer(self, tile):
+        '''A move received from the client, False if it was not asked for'''
+        if not self.waiting:
+            return False
+        try:
+            self.moves.put_nowait(tile)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def disconnect(self):
+        '''Stop waiting for a move, the client is gone'''
+        try:
+            self.moves.put_nowait(DISCONNECTED)
+        except asyncio.QueueFull:
+            # the waiter has moves to look at and finds the connection closed
+            pass
+
+    async def next_move(self, board, timeout):
+        '''The tile the client plays on board, like Player.play'''
+        legal = self.hand & board.playable()
+        if not legal:
+            return None
+        if self.connection.closed:
+            return self.play(board)
+
+        # moves sent after the last turn was over are stale
+        while not self.moves.empty():
+            self.moves.get_nowait()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        self.connection.send({'op': 'turn', 'ends': board.available_plays()
+                              if board.history else []})
+        self.waiting = True
+        try:
+            while True:
+                try:
+                    tile = await asyncio.wait_for(self.moves.get(),
+                                                  deadline - loop.time())
+                except asyncio.TimeoutError:
+                    self.timeouts += 1
+                    return self.play(board)
+                if tile is DISCONNECTED or self.connection.closed:
+                    return self.play(board)
+                try:
+                    n = tiles.index(tile)
+                except (KeyError, TypeError, IndexError):
+                    n = None
+                if n is not None and legal & tiles.BIT[n]:
+                    self.hand ^= tiles.BIT[n]
+                    return tiles.TILES[n]
+                self.connection.send({'op': 'error', 'error': 'illegal move',
+                                      'tile': tile})
+        finally:
+            self.waiting = False
+
+
+class Table(object):
+    def __init__(self, server, number, connections):
+        self.server = server
+        self.number = number
+        self.players = [NetworkPlayer(seat, c) for seat, c in enumerate(connections)]
+        for c, p in zip(connections, self.players):
+            c.player = p
+        self.game = Game(self.players, seed=server.seed(number), verbose=False)
+
+    def broadcast(self, msg):
+        for p in self.players:
+            p.connection.send(msg)
+
+    async def run(self):
+        game = self.game
+        game.deal()
+        for p in self.players:
+            p.connection.send({'op': 'start', 'table': self.number,
+                               'seat': p.seat, 'hand': p.dominoes})
+        while game.winner is None:
+            p = self.players[game.turn]
+            domino = await p.next_move(game.board, self.server.turn_timeout)
+            game.play_turn(domino)
+            self.server.moves += 1
+            self.broadcast({'op': 'played', 'seat': p.seat,
+                            'tile': list(domino) if domino else None})
+        self.broadcast({'op': 'over', 'winner': game.winner,
+                        'blocked': game.blocked})
+        for p in self.players:
+            p.connection.player = None
+
+
+class Server(object):
+    def __init__(self, max_tables=10000, turn_timeout=10.0, seed=None):
+        self.max_tables = max_tables
+        self.turn_timeout = turn_timeout
+        if seed is not None:
+            check_seed(seed)
+        self.base_seed = seed
+        self.tables = {}
+        self.lobby = []
+        self.count = 0
+        self.moves = 0
+        self.server = None
+        self.handlers = {}
+
+    def seed(self, number):
+        return None if self.base_seed is None else game_seed(self.base_seed, number)
+
+    async def start(self, host='127.0.0.1', port=8765):
+        self.server = await asyncio.start_server(self.handle, host, port)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        '''Stop listening, drop every client and wait for their handlers'''
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        handlers = list(self.handlers.values())
+        for connection in list(self.handlers):
+            connection.close()
+        await asyncio.gather(*handlers, return_exceptions=True)
+
+    def join(self, connection):
+        if connection.player is not None or connection in self.lobby:
+            connection.send({'op': 'error', 'error': 'already joined'})
+            return
+        if len(self.tables) >= self.max_tables:
+            connection.send({'op': 'error', 'error': 'server full'})
+            return
+        self.lobby.append(connection)
+        if len(self.lobby) == SEATS:
+            self.count += 1
+            table = Table(self, self.count, self.lobby)
+            self.lobby = []
+            self.tables[table.number] = table
+            task = asyncio.ensure_future(table.run())
+            task.add_done_callback(lambda t: self.table_done(table, t))
+
+    def table_done(self, table, task):
+        self.tables.pop(table.number, None)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            log.error('table %d failed', table.number,
+                      exc_info=(type(error), error, error.__traceback__))
+            for p in table.players:
+                p.connection.close()
+
+    async def handle(self, reader, writer):
+        connection = Connection(self, reader, writer)
+        writer_task = asyncio.ensure_future(connection.write_lines())
+        self.handlers[connection] = asyncio.current_task()
+        try:
+            while not connection.closed:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    msg = json.loads(line.decode('utf-8'))
+                    op = msg['op']
+                except (ValueError, KeyError, TypeError):
+                    connection.send({'op': 'error', 'error': 'bad message'})
+                    continue
+                if op == 'join':
+                    self.join(connection)
+                elif op == 'play':
+                    player = connection.player
+                    if player is None or not player.offer(msg.get('tile')):
+                        connection.send({'op': 'error', 'error': 'not your turn'})
+                else:
+                    connection.send({'op': 'error', 'error': 'unknown op'})
+        except (ConnectionError, OSError, ValueError):
+            pass
+        finally:
+            if connection in self.lobby:
+                self.lobby.remove(connection)
+            connection.close()
+            writer_task.cancel()
+            await asyncio.gather(writer_task, return_exceptions=True)
+            del self.handlers[connection]
+
+
+async def load_client(host, port, games, latencies):
+    '''One client playing games with the policy of Player.play, appends the
+    seconds from sending each move to seeing it played to latencies'''
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for g in range(games):
+            writer.write(b'{"op": "join"}\n')
+            hand = []
+            seat = None
+            sent = None
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                msg = json.loads(line.decode('utf-8'))
+                op = msg['op']
+                if op == 'start':
+                    seat = msg['seat']
+                    hand = [tuple(t) for t in msg['hand']]
+                elif op == 'turn':
+                    ends = msg['ends']
+                    legal = [t for t in hand if not ends or t[0] in ends or t[1] in ends]
+                    tile = max(legal, key=tiles.index)
+                    sent = time.perf_counter()
+                    writer.write(json.dumps({'op': 'play', 'tile': tile}).encode('utf-8')
+                                 + b'\n')
+                elif op == 'played' and msg['seat'] == seat and msg['tile']:
+                    if sent is not None:
+                        latencies.append(time.perf_counter() - sent)
+                        sent = None
+                    hand.remove(tuple(msg['tile']))
+                elif op == 'over':
+                    break
+                elif op == 'error':
+                    raise RuntimeError(msg['error'])
+    finally:
+        writer.close()
+
+
+def percentile(values, p):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * p / 100.0))]
+
+
+async def load(tables=100, games=5, turn_timeout=10.0):
+    '''Run a server and tables * 4 clients playing games each, returns
+    moves per second and the median and p99 turn latency in seconds'''
+    server = Server(max_tables=tables, turn_timeout=turn_timeout)
+    port = await server.start(port=0)
+    latencies = []
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*[load_client('127.0.0.1', port, games, latencies)
+                               for c in range(tables * SEATS)])
+    finally:
+        await server.stop()
+    seconds = time.perf_counter() - start
+    return {
+        'moves': server.moves,
+        'moves_per_second': server.moves / seconds,
+        'p50_latency': percentile(latencies, 50),
+        'p99_latency': percentile(latencies, 99),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Serve doublesix games over TCP')
+    ap.add_argument('--host', action='store', default='127.0.0.1')
+    ap.add_argument('--port', '-p', action='store', type=int, default=8765)
+    ap.add_argument('--tables', '-t', action='store', type=int, default=10000,
+                    help='Most tables played at once, with --load the tables to fill')
+    ap.add_argument('--timeout', action='store', type=float, default=10.0,
+                    help='Seconds a player has for a move')
+    ap.add_argument('--seed', '-s', action='store', type=int, default=None)
+    ap.add_argument('--load', action='store_true',
+                    help='Run a load generator against an in process server')
+    ap.add_argument('--games', '-g', action='store', type=int, default=5,
+                    help='Games each load generator client plays')
+    args = ap.parse_args()
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    if args.load:
+        result = loop.run_until_complete(load(args.tables, args.games, args.timeout))
+        print('{moves} moves, {moves_per_second:.0f} moves/s, '
+              'p50 {p50:.2f} ms, p99 {p99:.2f} ms'.format(
+                  p50=result['p50_latency'] * 1000, p99=result['p99_latency'] * 1000,
+                  **result))
+        loop.close()
+        return
+
+    try:
+        server = Server(args.tables, args.timeout, args.seed)
+    except ValueError as e:
+        ap.error(str(e))
+    loop.run_until_complete(server.start(args.host, args.port))
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        loop.run_until_complete(server.stop())
+        loop.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+from __future__ import print_function
+import argparse
+import multiprocessing
+from collections import Counter
+
+from doublesix import Player, Game
+from gamelog import Recorder, GameWriter
+
+SEATS = 4
+CHUNKSIZE = 1000
+# batch seeds and game indices each take 32 bits of a game seed, so game
+# seeds fit the u64 of a gamelog record
+SEED_LIMIT = 1 << 32
+
+
+class SimulationResult(object):
+    '''Aggregate outcome of a batch of games'''
+    def __init__(self):
+        self.games = 0
+        self.wins = [0] * SEATS
+        self.blocked = 0
+        self.lengths = Counter()
+
+    def add(self, game):
+        self.games += 1
+        self.wins[game.winner] += 1
+        self.blocked += game.blocked
+        self.lengths[game.moves] += 1
+
+    def merge(self, other):
+        self.games += other.games
+        self.wins = [a + b for a, b in zip(self.wins, other.wins)]
+        self.blocked += other.blocked
+        self.lengths.update(other.lengths)
+        return self
+
+    def win_rates(self):
+        return [float(w) / self.games if self.games else 0.0 for w in self.wins]
+
+    def blocked_rate(self):
+        return float(self.blocked) / self.games if self.games else 0.0
+
+    def __eq__(self, other):
+        return (isinstance(other, SimulationResult) and
+                (self.games, self.wins, self.blocked, self.lengths) ==
+                (other.games, other.wins, other.blocked, other.lengths))
+
+    def __repr__(self):
+        return 'SimulationResult(games={}, wins={}, blocked={})'.format(
+            self.games, self.wins, self.blocked)
+
+    def report(self):
+        lines = ['games: {}'.format(self.games)]
+        for seat, rate in enumerate(self.win_rates()):
+            lines.append('seat {} wins: {:.4f}'.format(seat, rate))
+        lines.append('blocked: {:.4f}'.format(self.blocked_rate()))
+        lines.append('length histogram (tiles played: games):')
+        for length in sorted(self.lengths):
+            lines.append('  {:2d}: {}'.format(length, self.lengths[length]))
+        return '\n'.join(lines)
+
+
+def check_seed(seed, games=1):
+    '''Raise ValueError unless games seeded from seed fit in 64 bits'''
+    if not 0 <= seed < SEED_LIMIT:
+        raise ValueError('seed {} is not in [0, 2**32)'.format(seed))
+    if games > SEED_LIMIT:
+        raise ValueError('at most 2**32 games can be seeded from one seed')
+
+
+def game_seed(seed, index):
+    '''Seed of one game, it only depends on the batch seed and the game index
+    so the outcome does not depend on how games are split between workers.
+    Both have to be in [0, 2**32), the game seed is then below 2**64'''
+    if not (0 <= seed < SEED_LIMIT and 0 <= index < SEED_LIMIT):
+        raise ValueError('seed {} and game {} do not make a 64 bit seed'
+                         .format(seed, index))
+    return (seed << 32) + index
+
+
+def run_games(job):
+    '''Play games [start, stop) of a batch silently.  When recording, returns
+    the gamelog records of the games along with the result'''
+    seed, start, stop, record = job
+    players = [Player(seat) for seat in range(SEATS)]
+    result = SimulationResult()
+    recorder = Recorder() if record else None
+    for index in range(start, stop):
+        game = Game(players, seed=game_seed(seed, index), verbose=False, log=recorder)
+        game.deal()
+        game.play_game()
+        result.add(game)
+    if record:
+        return result, recorder.records
+    return result
+
+
+def simulate(games, seed=0, workers=None, chunksize=CHUNKSIZE, log=None):
+    '''Play games seeded from seed on a pool of workers (default one per core)
+    and return the merged SimulationResult.  Given a gamelog.GameWriter as log
+    every game is recorded to it, in order'''
+    check_seed(seed, games)
+    record = log is not None
+    jobs = [(seed, start, min(start + chunksize, games), record)
+            for start in range(0, games, chunksize)]
+    total = SimulationResult()
+
+    def merge(result):
+        if record:
+            result, records = result
+            for r in records:
+                log.write(r)
+        total.merge(result)
+
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            merge(run_games(job))
+        return total
+
+    pool = multiprocessing.Pool(workers)
+    try:
+        # a log keeps the games in order
+        results = pool.imap(run_games, jobs) if record else \
+            pool.imap_unordered(run_games, jobs)
+        for result in results:
+            merge(result)
+    finally:
+        pool.close()
+        pool.join()
+    return total
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Simulate doublesix games without output')
+    ap.add_argument('--games', '-n', action='store', type=int, default=10000)
+    ap.add_argument('--seed', '-s', action='store', type=int, default=0)
+    ap.add_argument('--workers', '-w', action='store', type=int, default=None,
+                    help='Number of processes, default one per core')
+    ap.add_argument('--chunksize', action='store', type=int, default=CHUNKSIZE,
+                    help='Games handed to a worker at a time')
+    ap.add_argument('--log', action='store', default=None,
+                    help='Record every game to this gamelog file')
+    args = ap.parse_args()
+
+    try:
+        check_seed(args.seed, args.games)
+    except ValueError as e:
+        ap.error(str(e))
+    log = GameWriter(args.log) if args.log else None
+    try:
+        result = simulate(args.games, seed=args.seed, workers=args.workers,
+                          chunksize=args.chunksize, log=log)
+    finally:
+        if log is not None:
+            log.close()
+    print(result.report())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+import random
+import time
+
+import tiles
+from doublesix import Player, Game
+from search import SearchPlayer, TranspositionTable
+
+
+def put_seconds(table, keys):
+    start = time.perf_counter()
+    for depth, key in enumerate(keys):
+        table.put(key, (depth, 0, 0.0))
+    return time.perf_counter() - start
+
+
+def test_put_on_a_full_table_stays_flat():
+    rng = random.Random(1)
+    table = TranspositionTable(1 << 10)
+    batch = [rng.getrandbits(64) for i in range(20000)]
+    first = min(put_seconds(table, batch) for r in range(3))
+    # hundreds of thousands of replacements later
+    for r in range(20):
+        table.new_search()
+        put_seconds(table, [rng.getrandbits(64) for i in range(20000)])
+    later = min(put_seconds(table, batch) for r in range(3))
+    assert later < 3 * first
+
+
+def test_deeper_entries_are_kept_until_a_new_search():
+    table = TranspositionTable(16)
+    table.put(1, (5, 0, 1.0))
+    table.put(17, (2, 0, 2.0))      # same slot, shallower
+    assert table.get(1) == (5, 0, 1.0) and table.get(17) is None
+    table.put(17, (5, 0, 3.0))
+    assert table.get(17) == (5, 0, 3.0) and table.get(1) is None
+    table.new_search()
+    table.put(1, (0, 0, 4.0))
+    assert table.get(1) == (0, 0, 4.0)
+
+
+def test_stats_of_a_forced_move():
+    players = [SearchPlayer(0, node_budget=200, seed=1)] + [Player(s) for s in (1, 2, 3)]
+    game = Game(players, seed=3, verbose=False)
+    game.deal()
+    searched = forced = 0
+    while game.winner is None:
+        p = players[game.turn]
+        before = p.hand & game.board.playable() if p.seat == 0 else None
+        game.play_turn(p.play(game.board))
+        if p.seat == 0:
+            if tiles.count(before) > 1:
+                searched += 1
+                assert not p.stats['forced'] and p.stats['nodes'] > 0
+            else:
+                forced += 1
+                assert p.stats['forced'] and p.stats['nodes'] == 0
+    assert searched and forced
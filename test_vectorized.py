@@ -0,0 +1,10 @@
+import pytest
+
+pytest.importorskip('numpy')
+
+import vectorized
+
+
+@pytest.mark.parametrize('seed', [0, 1])
+def test_same_outcomes_as_scalar_engine(seed):
+    assert vectorized.check_equivalence(2000, seed) == []
@@ -0,0 +1,64 @@
+'''Index and bitmask representation of the 28 double-six dominoes
+
+Every tile has an index 0..27 in (0,0), (0,1), ... (6,6) order and a set of
+tiles, e.g. a hand, is an int with bit n set for tile n.  PIP_MASK[x] is the
+set of tiles showing x, so the tiles of a hand that match open ends x or y
+are hand & (PIP_MASK[x] | PIP_MASK[y]).
+'''
+
+TILES = tuple((i, j) for i in range(7) for j in range(i, 7))
+NTILES = len(TILES)
+ALL_TILES = (1 << NTILES) - 1
+
+TILE_INDEX = {}
+for _n, (_i, _j) in enumerate(TILES):
+    TILE_INDEX[(_i, _j)] = _n
+    TILE_INDEX[(_j, _i)] = _n
+
+BIT = tuple(1 << n for n in range(NTILES))
+PIPS = tuple(i + j for i, j in TILES)
+PIP_MASK = tuple(sum(BIT[n] for n, t in enumerate(TILES) if pip in t)
+                 for pip in range(7))
+DOUBLES = sum(BIT[n] for n, (i, j) in enumerate(TILES) if i == j)
+
+
+def index(domino):
+    '''Index of a domino given as a pair in either order'''
+    return TILE_INDEX[(domino[0], domino[1])]
+
+
+def mask(dominoes):
+    '''Set of the given dominoes (pairs)'''
+    m = 0
+    for d in dominoes:
+        m |= BIT[TILE_INDEX[(d[0], d[1])]]
+    return m
+
+
+def indices(m):
+    '''Tile indices in a set, lowest first'''
+    result = []
+    while m:
+        low = m & -m
+        result.append(low.bit_length() - 1)
+        m ^= low
+    return result
+
+
+def highest(m):
+    '''Highest tile index in a non empty set'''
+    return m.bit_length() - 1
+
+
+def count(m):
+    return bin(m).count('1')
+
+
+def pips(m):
+    '''Total pips of the tiles in a set'''
+    total = 0
+    while m:
+        low = m & -m
+        total += PIPS[low.bit_length() - 1]
+        m ^= low
+    return total
@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+'''Play thousands of doublesix games at once with NumPy
+
+A batch of games is an array of hand bitmasks hands[game, seat] (see
+tiles.py) plus one entry per game for the open ends, the seat to move and
+the count of passes.  Each step plays one turn of every unfinished game
+with the policy of Player.play: the highest legal tile, put down as
+Board.putdown does (left end first).  Outcomes follow Game.play_turn, a
+blocked game is won by the lowest count of pips in hand.
+'''
+from __future__ import print_function
+import argparse
+import collections
+import time
+
+import numpy as np
+
+import tiles
+from doublesix import Player, Game
+from simulate import SimulationResult, game_seed
+
+SEATS = 4
+HAND = 7
+EMPTY = 7  # end value of an empty board
+
+# tiles are looked up by their index + 1, 0 meaning no tile (a pass)
+BIT = np.array((0,) + tiles.BIT, dtype=np.int32)
+
+
+def _ends_tables():
+    '''The open ends of a board as one state, the tiles that can be played
+    in each state and the state after playing each tile.  A state is stored
+    as (left * 8 + right) * 29 so that state + n indexes the flat AFTER
+    table with n the tile index + 1, see highest(); a finished game is put
+    in the DEAD state where nothing is playable'''
+    width = tiles.NTILES + 1
+    states = (EMPTY + 1) ** 2 + 1
+    dead = (states - 1) * width
+    playable = np.zeros(states * width, dtype=np.int32)
+    after = np.full(states * width, dead, dtype=np.intp)
+    for left in range(EMPTY + 1):
+        for right in range(EMPTY + 1):
+            if (left == EMPTY) != (right == EMPTY):
+                continue
+            state = (left * (EMPTY + 1) + right) * width
+            if left == EMPTY:
+                playable[state] = tiles.ALL_TILES
+            else:
+                playable[state] = tiles.PIP_MASK[left] | tiles.PIP_MASK[right]
+            for n, (i, j) in enumerate(tiles.TILES):
+                l, r = left, right
+                if left == EMPTY:
+                    l, r = i, j
+                elif left in (i, j):
+                    l = j if i == left else i
+                elif right in (i, j):
+                    r = j if i == right else i
+                after[state + n + 1] = (l * (EMPTY + 1) + r) * width
+            after[state] = state
+    return playable, after, (states - 2) * width, dead
+
+PLAYABLE, AFTER, EMPTY_BOARD, DEAD = _ends_tables()
+# passes of a finished game, far enough below SEATS not to count as blocked
+# again before the game is dropped
+DEAD_PASSES = -1000
+# pips of every 7 bit chunk of a hand, to count a hand with 4 lookups
+CHUNK = 7
+CHUNK_PIPS = np.array([[tiles.pips(m << CHUNK * c) for m in range(1 << CHUNK)]
+                       for c in range(tiles.NTILES // CHUNK)], dtype=np.int16)
+CHUNK_COUNT = np.array([tiles.count(m) for m in range(1 << CHUNK)], dtype=np.int8)
+
+Outcomes = collections.namedtuple('Outcomes', 'winner moves blocked')
+
+
+def deal(games, seed=0):
+    '''Hand bitmasks of games shuffled deals, a games x seats array'''
+    rng = np.random.default_rng(seed)
+    # sort random keys carrying the tile index in their low bits, sorting
+    # ints is quicker than argsort or Generator.permuted on short rows
+    keys = rng.integers(0, 1 << 26, (games, tiles.NTILES), dtype=np.int32)
+    keys <<= 5
+    keys |= np.arange(tiles.NTILES, dtype=np.int32)
+    keys.sort(axis=1)
+    bits = np.left_shift(1, keys & 31, dtype=np.int32)
+    return bits.reshape(games, SEATS, HAND).sum(axis=2, dtype=np.int32)
+
+
+def from_masks(masks):
+    '''Hands array from hand bitmasks, a games x seats sequence of ints'''
+    return np.array(masks, dtype=np.int32)
+
+
+def pips(hands):
+    '''Total pips of an array of hand bitmasks'''
+    total = np.zeros(hands.shape, dtype=np.int16)
+    for c, table in enumerate(CHUNK_PIPS):
+        total += table[hands >> CHUNK * c & (1 << CHUNK) - 1]
+    return total
+
+
+def count(hands):
+    '''Number of tiles of an array of hand bitmasks'''
+    total = np.zeros(hands.shape, dtype=np.int8)
+    for c in range(len(CHUNK_PIPS)):
+        total += CHUNK_COUNT[hands >> CHUNK * c & (1 << CHUNK) - 1]
+    return total
+
+
+def highest(masks):
+    '''1 + index of the highest set bit of bitmasks, 0 for 0'''
+    return np.frexp(masks)[1]
+
+
+def play(hands):
+    '''Play every deal in hands to the end, hands is emptied as tiles are
+    played.  Returns Outcomes of arrays: winning seat, tiles played and
+    whether the game was blocked'''
+    games = len(hands)
+    winner = np.full(games, -1, dtype=np.int8)
+    moves = np.zeros(games, dtype=np.int8)
+    blocked = np.zeros(games, dtype=bool)
+
+    # the state of the games still being played, one array of hands per seat
+    # since every game is at the same seat on the same turn.  Finished games
+    # are put in the DEAD state and only dropped once there are enough of
+    # them, compressing the arrays costs more than a few idle turns
+    game = np.arange(games)
+    seats = [np.array(hands[:, seat]) for seat in range(SEATS)]
+    ends = np.full(games, EMPTY_BOARD, dtype=np.intp)
+    passes = np.zeros(games, dtype=np.int16)
+    finished = 0
+    turn = 0
+    while game.size:
+        seat = turn % SEATS
+        hand = seats[seat]
+        legal = PLAYABLE.take(ends)
+        legal &= hand
+        n = highest(legal)
+        hand ^= BIT.take(n)
+        ends += n
+        AFTER.take(ends, out=ends)
+        cannot = legal == 0
+        passes += 1
+        passes *= cannot
+        turn += 1
+
+        won = (hand == 0) & ~cannot
+        stuck = passes == SEATS
+        over = won | stuck
+        if not over.any():
+            continue
+        hold = np.array([h[over] for h in seats])
+        g = game[over]
+        won = won[over]
+        stuck = stuck[over]
+        winner[g[won]] = seat
+        blocked[g[stuck]] = True
+        winner[g[stuck]] = np.argmin(pips(hold[:, stuck]), axis=0)
+        moves[g] = tiles.NTILES - count(hold).sum(axis=0)
+        hands[g] = hold.T
+        ends[over] = DEAD
+        passes[over] = DEAD_PASSES
+
+        finished += len(g)
+        if finished * 8 > game.size or finished == game.size:
+            keep = ends != DEAD
+            game = game[keep]
+            seats = [h[keep] for h in seats]
+            ends = ends[keep]
+            passes = passes[keep]
+            finished = 0
+
+    return Outcomes(winner, moves, blocked)
+
+
+def simulate(games, seed=0):
+    '''Deal and play games at once, returns per deal Outcomes'''
+    return play(deal(games, seed))
+
+
+def summarize(outcomes):
+    '''SimulationResult of a batch of Outcomes'''
+    result = SimulationResult()
+    result.games = len(outcomes.winner)
+    result.wins = np.bincount(outcomes.winner, minlength=SEATS).tolist()
+    result.blocked = int(outcomes.blocked.sum())
+    lengths = np.bincount(outcomes.moves)
+    result.lengths = collections.Counter(
+        dict((n, int(c)) for n, c in enumerate(lengths) if c))
+    return result
+
+
+def scalar_games(games, seed=0):
+    '''Play games with doublesix.Game seeded as simulate.run_games does.
+    Returns the hand bitmasks of the deals and their Outcomes'''
+    players = [Player(seat) for seat in range(SEATS)]
+    masks = []
+    winner = []
+    moves = []
+    blocked = []
+    for index in range(games):
+        game = Game(players, seed=game_seed(seed, index), verbose=False)
+        game.deal()
+        masks.append([p.hand for p in players])
+        game.play_game()
+        winner.append(game.winner)
+        moves.append(game.moves)
+        blocked.append(game.blocked)
+    return masks, Outcomes(np.array(winner), np.array(moves), np.array(blocked))
+
+
+def check_equivalence(games=1000, seed=0, timings=None):
+    '''Play the same seeded deals with doublesix.Game and with play() and
+    return the indices of the deals where the outcomes differ.  Given a
+    dict as timings, the seconds each engine took are stored in it'''
+    start = time.time()
+    masks, expected = scalar_games(games, seed)
+    scalar = time.time() - start
+    hands = from_masks(masks)
+    start = time.time()
+    got = play(hands)
+    vector = time.time() - start
+    if timings is not None:
+        timings['scalar'] = scalar
+        timings['vectorized'] = vector
+    same = ((got.winner == expected.winner) & (got.moves == expected.moves) &
+            (got.blocked == expected.blocked))
+    return np.flatnonzero(~same).tolist()
+
+
+def main():
+    ap = argparse.ArgumentParser(description='Play doublesix games as NumPy arrays')
+    ap.add_argument('--games', '-n', action='store', type=int, default=100000)
+    ap.add_argument('--seed', '-s', action='store', type=int, default=0)
+    ap.add_argument('--check', action='store_true',
+                    help='Compare with doublesix.Game on seeded deals instead')
+    args = ap.parse_args()
+
+    if args.check:
+        timings = {}
+        differ = check_equivalence(args.games, args.seed, timings)
+        print('{} deals, {} differ'.format(args.games, len(differ)))
+        print('scalar {:.0f} games/s, vectorized {:.0f} games/s, {:.0f}x'.format(
+            args.games / timings['scalar'], args.games / timings['vectorized'],
+            timings['scalar'] / timings['vectorized']))
+        if differ:
+            raise SystemExit(1)
+        return
+
+    start = time.time()
+    result = summarize(simulate(args.games, args.seed))
+    seconds = time.time() - start
+    print(result.report())
+    print('{:.0f} games/s'.format(args.games / seconds))
+
+
+if __name__ == '__main__':
+    main()